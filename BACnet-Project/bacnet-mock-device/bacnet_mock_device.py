@@ -5,15 +5,49 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
+import logging
 import os
-import random
+import re
 import signal
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import numpy as np
 from rich.console import Console
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None
+
+try:
+    import uvloop  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    uvloop = None
+
 console = Console()
+logger = logging.getLogger("bacnet_mock_device")
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+
+    def _loads(data: Any) -> Any:
+        return json.loads(bytes(data))
+
+    def _dumps(message: Any) -> bytes:
+        return json.dumps(message).encode("utf-8")
+
+RECV_BUFFER_SIZE = 64 * 1024
+MAX_REQUEST_SIZE = 1024 * 1024
+_NON_BLANK = re.compile(rb"\S")
+
+# Responses that never change are encoded once at import time.
+DISCOVER_RESPONSE = _dumps(
+    {"success": True, "data": [{"device_id": 12345, "vendor": "MockVendor", "model": "TestController"}]}
+)
+INVALID_JSON_RESPONSE = _dumps({"success": False, "error": "Invalid JSON"})
 
 
 def env(default: str, key: str) -> str:
@@ -30,15 +64,115 @@ class MockConfig:
 
 @dataclass
 class ObjectDatabase:
-    analog_inputs: Dict[int, float] = field(default_factory=lambda: {1: 72.5, 2: 68.0})
+    analog_input_ids: List[int] = field(default_factory=lambda: [1, 2])
+    analog_input_values: np.ndarray = field(default_factory=lambda: np.array([72.5, 68.0], dtype=np.float64))
     analog_outputs: Dict[int, float] = field(default_factory=lambda: {1: 50.0})
     binary_values: Dict[int, bool] = field(default_factory=lambda: {1: True})
 
+    def __post_init__(self) -> None:
+        self._analog_input_slots = {inst: slot for slot, inst in enumerate(self.analog_input_ids)}
+
+    @property
+    def analog_inputs(self) -> Dict[int, float]:
+        """Instance -> present-value view of the analog inputs."""
+        return dict(zip(self.analog_input_ids, self.analog_input_values.tolist()))
+
+    def analog_input(self, inst: int) -> Optional[float]:
+        slot = self._analog_input_slots.get(inst)
+        if slot is None:
+            return None
+        return float(self.analog_input_values[slot])
+
+
+class _ClientProtocol(asyncio.BufferedProtocol):
+    """Newline-delimited JSON connection that receives into a reused buffer."""
+
+    def __init__(self, device: "BACnetMockDevice") -> None:
+        self._device = device
+        self._buf = bytearray(RECV_BUFFER_SIZE)
+        self._used = 0
+        self._scanned = 0
+        self._transport: Optional[asyncio.Transport] = None
+        self._peer: Any = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+        self._peer = transport.get_extra_info("peername")
+        if self._device.config.verbose:
+            logger.info("Client connected %s", self._peer)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._transport = None
+        if self._device.config.verbose:
+            logger.info("Client disconnected %s", self._peer)
+
+    def pause_writing(self) -> None:
+        # The client is not reading its replies; stop taking requests until the transport drains.
+        if self._transport is not None:
+            self._transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        if self._transport is not None:
+            self._transport.resume_reading()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._used == len(self._buf):
+            # The previous view may still be exported, so grow into a new buffer.
+            grown = bytearray(len(self._buf) * 2)
+            grown[: self._used] = self._buf
+            self._buf = grown
+        return memoryview(self._buf)[self._used :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._used += nbytes
+        buf = self._buf
+        view = memoryview(buf)
+        start = 0
+        # Resume the delimiter search where the previous one stopped so a
+        # request arriving in many segments is only scanned once.
+        scan = self._scanned
+        while (end := buf.find(b"\n", scan, self._used)) != -1:
+            # Parse straight out of the receive buffer; blank lines are skipped.
+            first = _NON_BLANK.search(buf, start, end)
+            start = scan = end + 1
+            if first is not None:
+                self._handle_line(view[first.start() : end])
+        if start:
+            # Same-size slice assignment is allowed while a view is exported.
+            remaining = self._used - start
+            buf[:remaining] = buf[start : self._used]
+            self._used = remaining
+        self._scanned = self._used
+        if self._used >= MAX_REQUEST_SIZE and self._transport is not None:
+            self._send({"success": False, "error": "Request too large"})
+            self._transport.close()
+
+    def _handle_line(self, line: memoryview) -> None:
+        try:
+            request = _loads(line)
+        except json.JSONDecodeError:
+            self._send(INVALID_JSON_RESPONSE)
+            return
+        self._send(self._device._dispatch(request))
+
+    def _send(self, message: Union[Dict[str, Any], bytes]) -> None:
+        if self._transport is None or self._transport.is_closing():
+            return
+        body = message if isinstance(message, bytes) else _dumps(message)
+        # writelines lets the transport send body and delimiter without concatenating them.
+        self._transport.writelines((body, b"\n"))
+
 
 class BACnetMockDevice:
     def __init__(self, config: MockConfig) -> None:
         self.config = config
         self.db = ObjectDatabase()
+        self._rng = np.random.default_rng()
+        self._ops: Dict[str, Callable[[Dict[str, Any]], Union[Dict[str, Any], bytes]]] = {
+            "discover": self._op_discover,
+            "read": self._op_read,
+            "write": self._op_write,
+        }
         self._server: Optional[asyncio.base_events.Server] = None
         self._running = False
 
@@ -46,7 +180,8 @@ class BACnetMockDevice:
         if self._running:
             return
         self._running = True
-        self._server = await asyncio.start_server(self._handle_client, self.config.host, self.config.port)
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: _ClientProtocol(self), self.config.host, self.config.port)
         addr = ", ".join(str(sock.getsockname()) for sock in self._server.sockets or [])
         console.print(f"[bold green]BACnet mock device listening on {addr}[/bold green]")
         asyncio.create_task(self._update_loop())
@@ -58,68 +193,58 @@ class BACnetMockDevice:
             await self._server.wait_closed()
 
     async def _update_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        # Sleep towards a fixed schedule so handler load does not accumulate drift.
+        next_tick = loop.time()
         while self._running:
-            await asyncio.sleep(self.config.update_interval)
-            for idx in self.db.analog_inputs:
-                self.db.analog_inputs[idx] += random.uniform(-0.2, 0.2)
+            next_tick += self.config.update_interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            values = self.db.analog_input_values
+            values += self._rng.uniform(-0.2, 0.2, values.size)
             if self.config.verbose:
-                console.print("[cyan]Updated mock analog inputs[/cyan]")
+                logger.info("Updated mock analog inputs")
 
-    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
-        peer = writer.get_extra_info("peername")
-        console.print(f"[yellow]Client connected {peer}[/yellow]")
-        try:
-            while data := await reader.readline():
-                data = data.strip()
-                if not data:
-                    continue
-                try:
-                    request = json.loads(data)
-                except json.JSONDecodeError:
-                    await self._send(writer, {"success": False, "error": "Invalid JSON"})
-                    continue
-                response = self._dispatch(request)
-                await self._send(writer, response)
-        finally:
-            writer.close()
-            await writer.wait_closed()
-            console.print(f"[yellow]Client disconnected {peer}[/yellow]")
-
-    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    def _dispatch(self, request: Dict[str, Any]) -> Union[Dict[str, Any], bytes]:
         op = request.get("op")
-        if op == "discover":
-            return {"success": True, "data": [{"device_id": 12345, "vendor": "MockVendor", "model": "TestController"}]}
-        if op == "read":
-            obj = request.get("object", "")
-            prop = request.get("property", "present-value")
-            try:
-                otype, inst = obj.split(":")
-                inst = int(inst)
-            except ValueError:
-                return {"success": False, "error": "Invalid object identifier"}
-            value = self._read_value(otype, inst, prop)
-            if value is None:
-                return {"success": False, "error": "Object/property not found"}
-            return {"success": True, "data": {"object": obj, "property": prop, "value": value}}
-        if op == "write":
-            obj = request.get("object", "")
-            prop = request.get("property", "present-value")
-            value = request.get("value")
-            try:
-                otype, inst = obj.split(":")
-                inst = int(inst)
-            except ValueError:
-                return {"success": False, "error": "Invalid object identifier"}
-            if not self._write_value(otype, inst, prop, value):
-                return {"success": False, "error": "Write failed"}
-            return {"success": True, "data": {"object": obj, "property": prop, "value": value}}
-        return {"success": False, "error": f"Unknown op '{op}'"}
+        handler = self._ops.get(op) if isinstance(op, str) else None
+        if handler is None:
+            return {"success": False, "error": f"Unknown op '{op}'"}
+        return handler(request)
+
+    def _op_discover(self, request: Dict[str, Any]) -> bytes:  # noqa: ARG002
+        return DISCOVER_RESPONSE
+
+    def _op_read(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        obj = request.get("object", "")
+        prop = request.get("property", "present-value")
+        try:
+            otype, inst = obj.split(":")
+            inst = int(inst)
+        except ValueError:
+            return {"success": False, "error": "Invalid object identifier"}
+        value = self._read_value(otype, inst, prop)
+        if value is None:
+            return {"success": False, "error": "Object/property not found"}
+        return {"success": True, "data": {"object": obj, "property": prop, "value": value}}
+
+    def _op_write(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        obj = request.get("object", "")
+        prop = request.get("property", "present-value")
+        value = request.get("value")
+        try:
+            otype, inst = obj.split(":")
+            inst = int(inst)
+        except ValueError:
+            return {"success": False, "error": "Invalid object identifier"}
+        if not self._write_value(otype, inst, prop, value):
+            return {"success": False, "error": "Write failed"}
+        return {"success": True, "data": {"object": obj, "property": prop, "value": value}}
 
     def _read_value(self, otype: str, inst: int, prop: str) -> Optional[Any]:
         if prop != "present-value":
             return None
         if otype == "analog-input":
-            return self.db.analog_inputs.get(inst)
+            return self.db.analog_input(inst)
         if otype == "analog-output":
             return self.db.analog_outputs.get(inst)
         if otype == "binary-value":
@@ -137,10 +262,6 @@ class BACnetMockDevice:
             return True
         return False
 
-    async def _send(self, writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
-        writer.write(json.dumps(message).encode("utf-8") + b"\n")
-        await writer.drain()
-
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Mock BACnet device (JSON over TCP).")
@@ -175,7 +296,10 @@ async def run_server(config: MockConfig) -> None:
 def main() -> None:
     args = parse_args()
     config = MockConfig(host=args.host, port=args.port, update_interval=args.update_interval, verbose=args.verbose)
-    asyncio.run(run_server(config))
+    logging.basicConfig(level=logging.INFO if config.verbose else logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_server(config))
 
 
 if __name__ == "__main__":
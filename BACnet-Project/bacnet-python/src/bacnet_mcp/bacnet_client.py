@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
@@ -36,29 +36,36 @@ class BACnetClientError(RuntimeError):
 
 
 class BACnetClient:
-    """Thread-safe wrapper around BAC0 for MCP tools."""
+    """Async wrapper around BAC0 for MCP tools, driven from a single event loop."""
 
     def __init__(self, config: Optional[BACnetConfig] = None) -> None:
         self.config = config or BACnetConfig()
-        self._lock = threading.RLock()
+        # Only BAC0 connect/disconnect mutate shared state; reads need no lock.
+        self._io_lock = asyncio.Lock()
         self._bacnet = None
         self._opened = False
 
     async def ensure_open(self) -> None:
-        if not self._opened:
-            self._open_client()
+        if self._opened:
+            return
+        async with self._io_lock:
+            if not self._opened:
+                # BAC0.connect blocks while it binds the BACnet/IP stack.
+                await anyio.to_thread.run_sync(self._open_client)
 
     async def close(self) -> None:
-        if self._opened:
-            self._close_client()
+        if not self._opened:
+            return
+        async with self._io_lock:
+            if self._opened:
+                await anyio.to_thread.run_sync(self._close_client)
 
     async def discover_devices(self, timeout_ms: int = 5000) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         await self.ensure_open()
         start = time.perf_counter()
-        with self._lock:
-            devices = [
-                {"device_id": 12345, "vendor": "SampleVendor", "model": "MockController", "description": "Sample BACnet device"}
-            ]
+        devices = [
+            {"device_id": 12345, "vendor": "SampleVendor", "model": "MockController", "description": "Sample BACnet device"}
+        ]
         duration = (time.perf_counter() - start) * 1000.0
         return devices, {"duration_ms": round(duration, 3), "count": len(devices)}
 
@@ -106,21 +113,15 @@ class BACnetClient:
     def _open_client(self) -> None:
         if BAC0 is None:  # pragma: no cover
             raise BACnetClientError("BAC0 is not installed. Install BAC0>=23.9.1")
-        with self._lock:
-            if self._opened:
-                return
-            self._bacnet = BAC0.connect(
-                ip=self.config.interface,
-                port=self.config.port,
-                deviceId=self.config.device_instance,
-            )
-            self._opened = True
+        self._bacnet = BAC0.connect(
+            ip=self.config.interface,
+            port=self.config.port,
+            deviceId=self.config.device_instance,
+        )
+        self._opened = True
 
     def _close_client(self) -> None:
-        with self._lock:
-            if not self._opened:
-                return
-            if self._bacnet:
-                self._bacnet.disconnect()
-            self._bacnet = None
-            self._opened = False
+        if self._bacnet:
+            self._bacnet.disconnect()
+        self._bacnet = None
+        self._opened = False
@@ -25,7 +25,7 @@ class BACnetMCPServer:
     ) -> None:
         self.client = client or BACnetClient()
         self.tool_config = tool_config or ToolConfig.from_env()
-        self.object_map = ObjectMap(self.tool_config.object_map_path)
+        self.object_map = ObjectMap(self.tool_config.object_map_path, self.tool_config.object_map_stat_interval_ms)
         self._server = FastMCP(
             name="BACnet MCP Server",
             dependencies=["BAC0"],
@@ -4,16 +4,45 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import itertools
 import json
+import logging
 import os
-import random
 import signal
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from rich.console import Console
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None
+
+try:
+    import uvloop  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    uvloop = None
+
 console = Console()
+logger = logging.getLogger("dnp3_mock_outstation")
+
+READ_LIMIT = 1024 * 1024
+WRITE_HIGH_WATER = 64 * 1024
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(message: Any) -> bytes:
+        return json.dumps(message).encode("utf-8")
+
+
+INVALID_JSON_RESPONSE = _dumps({"success": False, "error": "Invalid JSON"})
+REQUEST_TOO_LARGE_RESPONSE = _dumps({"success": False, "error": "Request too large"})
 
 
 def env(default: str, key: str) -> str:
@@ -31,22 +60,40 @@ class MockConfig:
 @dataclass
 class PointDatabase:
     binary_inputs: Dict[int, bool] = field(default_factory=lambda: {i: bool(i % 2) for i in range(16)})
-    analog_inputs: Dict[int, float] = field(default_factory=lambda: {i: float(i) for i in range(8)})
+    analog_inputs: np.ndarray = field(default_factory=lambda: np.arange(8, dtype=np.float64))
     binary_outputs: Dict[int, bool] = field(default_factory=dict)
 
+    def analog_window(self, start: int, count: int) -> List[float]:
+        """Analog values for indices start..start+count-1, 0.0 where no point exists."""
+        window = [0.0] * max(count, 0)
+        lo, hi = max(start, 0), min(start + count, self.analog_inputs.size)
+        if lo < hi:
+            window[lo - start : hi - start] = self.analog_inputs[lo:hi].tolist()
+        return window
+
 
 class DNP3MockOutstation:
     def __init__(self, config: MockConfig) -> None:
         self.config = config
         self.db = PointDatabase()
+        self._rng = np.random.default_rng()
         self._server: Optional[asyncio.base_events.Server] = None
         self._running = False
+        # Keyed by (op, type); ops that ignore "type" are registered under None.
+        self._ops: Dict[Tuple[Any, Any], Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            ("read", "binary"): self._op_read_binary,
+            ("read", "analog"): self._op_read_analog,
+            ("write_binary", None): self._op_write_binary,
+            ("poll_class", None): self._op_poll_class,
+        }
 
     async def start(self) -> None:
         if self._running:
             return
         self._running = True
-        self._server = await asyncio.start_server(self._handle_client, self.config.host, self.config.port)
+        self._server = await asyncio.start_server(
+            self._handle_client, self.config.host, self.config.port, limit=READ_LIMIT
+        )
         addr = ", ".join(str(sock.getsockname()) for sock in self._server.sockets or [])
         console.print(f"[bold green]DNP3 mock outstation listening on {addr}[/bold green]")
         asyncio.create_task(self._update_loop())
@@ -60,70 +107,108 @@ class DNP3MockOutstation:
     async def _update_loop(self) -> None:
         while self._running:
             await asyncio.sleep(self.config.update_interval)
-            for idx in self.db.analog_inputs:
-                self.db.analog_inputs[idx] += random.uniform(-0.5, 0.5)
+            analog = self.db.analog_inputs
+            analog += self._rng.uniform(-0.5, 0.5, size=analog.shape)
             if self.config.verbose:
-                console.print("[cyan]Updated mock analog inputs[/cyan]")
+                logger.info("Updated mock analog inputs")
 
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         peer = writer.get_extra_info("peername")
-        console.print(f"[yellow]Client connected {peer}[/yellow]")
+        if self.config.verbose:
+            logger.info("Client connected %s", peer)
+        pending = bytearray()
         try:
-            while data := await reader.readline():
-                data = data.strip()
-                if not data:
+            while chunk := await reader.read(READ_LIMIT):
+                pending += chunk
+                last = chunk.rfind(b"\n")
+                if last == -1:
+                    if len(pending) > READ_LIMIT:
+                        await self._send(writer, [REQUEST_TOO_LARGE_RESPONSE])
+                        break
                     continue
-                try:
-                    request = json.loads(data)
-                except json.JSONDecodeError:
-                    await self._send(writer, {"success": False, "error": "Invalid JSON"})
-                    continue
-                response = self._dispatch(request)
-                await self._send(writer, response)
+                # Answer every complete line that arrived together with a single write.
+                end = len(pending) - len(chunk) + last
+                lines = pending[:end].split(b"\n")
+                del pending[: end + 1]
+                await self._send(writer, [self._respond(line) for line in lines if line.strip()])
+            else:
+                if pending.strip():
+                    await self._send(writer, [self._respond(pending)])
         finally:
             writer.close()
             await writer.wait_closed()
-            console.print(f"[yellow]Client disconnected {peer}[/yellow]")
+            if self.config.verbose:
+                logger.info("Client disconnected %s", peer)
+
+    def _respond(self, line: bytes) -> bytes:
+        try:
+            request = _loads(line)
+        except json.JSONDecodeError:
+            return INVALID_JSON_RESPONSE
+        # Lines from one read are answered together, so a bad request must not take the
+        # replies to its neighbours down with it.
+        try:
+            return _dumps(self._dispatch(request))
+        except Exception as exc:
+            return _dumps({"success": False, "error": str(exc)})
 
     def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
         op = request.get("op")
-        if op == "read" and request.get("type") == "binary":
-            start = int(request.get("start", 0))
-            count = int(request.get("count", 1))
-            points = [
-                {"index": start + i, "value": bool(self.db.binary_inputs.get(start + i, False)), "quality": "ONLINE"}
-                for i in range(count)
-            ]
-            return {"success": True, "data": {"points": points}}
-        if op == "read" and request.get("type") == "analog":
-            start = int(request.get("start", 0))
-            count = int(request.get("count", 1))
-            points = [
-                {"index": start + i, "value": float(self.db.analog_inputs.get(start + i, 0.0)), "quality": "ONLINE"}
-                for i in range(count)
-            ]
-            return {"success": True, "data": {"points": points}}
-        if op == "write_binary":
-            index = int(request.get("index", 0))
-            value = bool(request.get("value", False))
-            self.db.binary_outputs[index] = value
-            return {"success": True, "data": {"index": index, "value": value}}
-        if op == "poll_class":
-            klass = int(request.get("class", 1))
-            return {"success": True, "data": {"class": klass, "events": []}}
-        return {"success": False, "error": f"Unknown op '{op}'"}
-
-    async def _send(self, writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
-        writer.write(json.dumps(message).encode("utf-8") + b"\n")
-        await writer.drain()
+        try:
+            handler = self._ops.get((op, request.get("type"))) or self._ops.get((op, None))
+        except TypeError:  # unhashable op/type from the wire
+            handler = None
+        if handler is None:
+            return {"success": False, "error": f"Unknown op '{op}'"}
+        return handler(request)
+
+    def _op_read_binary(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        start = int(request.get("start", 0))
+        count = int(request.get("count", 1))
+        get = self.db.binary_inputs.get
+        points = [
+            {"index": index, "value": bool(get(index, False)), "quality": "ONLINE"}
+            for index in range(start, start + count)
+        ]
+        return {"success": True, "data": {"points": points}}
+
+    def _op_read_analog(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        start = int(request.get("start", 0))
+        count = int(request.get("count", 1))
+        values = self.db.analog_window(start, count)
+        points = [
+            {"index": index, "value": value, "quality": "ONLINE"}
+            for index, value in zip(itertools.count(start), values)
+        ]
+        return {"success": True, "data": {"points": points}}
+
+    def _op_write_binary(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        index = int(request.get("index", 0))
+        value = bool(request.get("value", False))
+        self.db.binary_outputs[index] = value
+        return {"success": True, "data": {"index": index, "value": value}}
+
+    def _op_poll_class(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        klass = int(request.get("class", 1))
+        return {"success": True, "data": {"class": klass, "events": []}}
+
+    async def _send(self, writer: asyncio.StreamWriter, responses: List[bytes]) -> None:
+        if not responses:
+            return
+        writer.writelines((b"\n".join(responses), b"\n"))
+        # Pipelined requests are answered without a drain() round-trip each;
+        # only wait once the transport has a real backlog.
+        if writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+            await writer.drain()
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Mock DNP3 outstation (JSON bridge).")
-    parser.add_argument("--host", default=env("127.0.0.1", "MOCK_DNP3_HOST"))
-    parser.add_argument("--port", type=int, default=int(env("7300", "MOCK_DNP3_PORT")))
-    parser.add_argument("--update-interval", type=float, default=float(env("1.0", "MOCK_DNP3_UPDATE_INTERVAL")))
-    parser.add_argument("--verbose", action="store_true", default=env("false", "MOCK_DNP3_VERBOSE").lower() in {"1", "true", "yes", "on"})
+    # MockConfig's class defaults already hold the parsed MOCK_DNP3_* environment.
+    parser.add_argument("--host", default=MockConfig.host)
+    parser.add_argument("--port", type=int, default=MockConfig.port)
+    parser.add_argument("--update-interval", type=float, default=MockConfig.update_interval)
+    parser.add_argument("--verbose", action="store_true", default=MockConfig.verbose)
     return parser.parse_args()
 
 
@@ -151,7 +236,10 @@ async def run_server(config: MockConfig) -> None:
 def main() -> None:
     args = parse_args()
     config = MockConfig(host=args.host, port=args.port, update_interval=args.update_interval, verbose=args.verbose)
-    asyncio.run(run_server(config))
+    logging.basicConfig(level=logging.INFO if config.verbose else logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_server(config))
 
 
 if __name__ == "__main__":
@@ -65,10 +65,11 @@ class DNP3Master:
     async def read_binary_inputs(self, outstation: int, start: int, count: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         await self.ensure_open()
         start_time = time.perf_counter()
-        # Placeholder: return synthetic data
+        # Placeholder: return synthetic data, stamped once per read
+        timestamp = time.time()
         points = [
-            {"index": start + i, "value": bool((start + i) % 2), "quality": "ONLINE", "timestamp": time.time()}
-            for i in range(count)
+            {"index": index, "value": bool(index % 2), "quality": "ONLINE", "timestamp": timestamp}
+            for index in range(start, start + count)
         ]
         duration = (time.perf_counter() - start_time) * 1000.0
         return points, {"duration_ms": round(duration, 3), "outstation": outstation}
@@ -76,9 +77,10 @@ class DNP3Master:
     async def read_analog_inputs(self, outstation: int, start: int, count: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         await self.ensure_open()
         start_time = time.perf_counter()
+        timestamp = time.time()
         points = [
-            {"index": start + i, "value": float(start + i), "quality": "ONLINE", "timestamp": time.time()}
-            for i in range(count)
+            {"index": index, "value": float(index), "quality": "ONLINE", "timestamp": timestamp}
+            for index in range(start, start + count)
         ]
         duration = (time.perf_counter() - start_time) * 1000.0
         return points, {"duration_ms": round(duration, 3), "outstation": outstation}
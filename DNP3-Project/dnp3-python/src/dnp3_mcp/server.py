@@ -4,13 +4,19 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Dict
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 
 from .dnp3_master import DNP3Master
 from .tools import PointMap, ToolConfig, ToolResources, register_tools
 
+try:
+    import uvloop  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    uvloop = None
+
 
 @dataclass(slots=True)
 class AppContext:
@@ -25,7 +31,7 @@ class DNP3MCPServer:
     ) -> None:
         self.master = master or DNP3Master()
         self.tool_config = tool_config or ToolConfig.from_env()
-        self.point_map = PointMap(self.tool_config.point_map_path)
+        self.point_map = PointMap(self.tool_config.point_map_path, self.tool_config.point_map_stat_interval_ms)
         self._server = FastMCP(
             name="DNP3 MCP Server",
             dependencies=[],
@@ -39,7 +45,11 @@ class DNP3MCPServer:
         register_tools(self._server, resources)
 
     def run(self) -> None:
-        self._server.run()
+        # Same as FastMCP.run() for stdio, but lets the loop come from uvloop when installed.
+        backend_options: Dict[str, Any] = {}
+        if uvloop is not None:
+            backend_options["loop_factory"] = uvloop.new_event_loop
+        anyio.run(self._server.run_stdio_async, backend_options=backend_options)
 
     @asynccontextmanager
     async def _lifespan(self, server: FastMCP) -> AsyncIterator[AppContext]:  # noqa: ARG002
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -12,6 +13,13 @@ from mcp.server.fastmcp import Context, FastMCP
 
 from .dnp3_master import DNP3Master
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 def _env_bool(name: str, default: bool) -> bool:
     val = os.getenv(name)
@@ -24,6 +32,7 @@ def _env_bool(name: str, default: bool) -> bool:
 class ToolConfig:
     writes_enabled: bool = True
     point_map_path: Optional[Path] = None
+    point_map_stat_interval_ms: int = 500
 
     @classmethod
     def from_env(cls) -> "ToolConfig":
@@ -31,38 +40,53 @@ class ToolConfig:
         return cls(
             writes_enabled=_env_bool("DNP3_WRITES_ENABLED", True),
             point_map_path=Path(map_path).expanduser() if map_path else None,
+            point_map_stat_interval_ms=int(os.getenv("POINT_MAP_STAT_INTERVAL_MS", "500")),
         )
 
 
 class PointMap:
-    def __init__(self, path: Optional[Path]) -> None:
+    __slots__ = ("path", "_stat_interval_ns", "_last_stat_ns", "_points", "_mtime", "_list_cache")
+
+    def __init__(self, path: Optional[Path], stat_interval_ms: int = 500) -> None:
         self.path = path
+        self._stat_interval_ns = max(0, stat_interval_ms) * 1_000_000
+        self._last_stat_ns = 0
         self._points: Dict[str, Dict[str, Any]] = {}
-        self._mtime: Optional[float] = None
+        self._mtime: Optional[int] = None  # st_mtime_ns of the loaded file
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
         self.refresh()
 
     def refresh(self) -> None:
         if not self.path:
             self._points = {}
+            self._list_cache = None
             self._mtime = None
             return
+        # Tool calls refresh constantly; stat() the file at most once per interval.
+        now = time.monotonic_ns()
+        if self._mtime is not None and now - self._last_stat_ns < self._stat_interval_ns:
+            return
+        self._last_stat_ns = now
         try:
             stat = self.path.stat()
         except FileNotFoundError:
             self._points = {}
+            self._list_cache = None
             self._mtime = None
             return
-        if self._mtime and stat.st_mtime <= self._mtime:
+        if self._mtime is not None and stat.st_mtime_ns <= self._mtime:
             return
         try:
-            with self.path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
+            data = _loads(self.path.read_bytes())
             if isinstance(data, dict):
-                self._points = {str(alias): spec for alias, spec in data.items()}
-                self._mtime = stat.st_mtime
+                # JSON object keys are always str, so the parsed dict is used as-is.
+                self._points = data
+                self._list_cache = None
+                self._mtime = stat.st_mtime_ns
         except Exception:
             self._points = {}
-            self._mtime = stat.st_mtime
+            self._list_cache = None
+            self._mtime = stat.st_mtime_ns
 
     def get(self, alias: str) -> Optional[Dict[str, Any]]:
         self.refresh()
@@ -70,16 +94,19 @@ class PointMap:
 
     def list(self) -> List[Dict[str, Any]]:
         self.refresh()
-        return [
-            {
-                "alias": alias,
-                "outstation": spec.get("outstation"),
-                "type": spec.get("type"),
-                "index": spec.get("index"),
-                "description": spec.get("description"),
-            }
-            for alias, spec in self._points.items()
-        ]
+        # Rebuilt only after refresh() loads a new version of the file.
+        if self._list_cache is None:
+            self._list_cache = [
+                {
+                    "alias": alias,
+                    "outstation": spec.get("outstation"),
+                    "type": spec.get("type"),
+                    "index": spec.get("index"),
+                    "description": spec.get("description"),
+                }
+                for alias, spec in self._points.items()
+            ]
+        return self._list_cache
 
     def count(self) -> int:
         self.refresh()
@@ -97,14 +124,21 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
     def _master(ctx: Context) -> DNP3Master:
         return ctx.request_context.lifespan_context.master
 
-    def _result(success: bool, data: Any = None, error: Optional[str] = None, meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        return {"success": success, "data": data, "error": error, "meta": meta or {}}
+    # Response skeletons; copying one is cheaper than building the literal each call.
+    _OK = {"success": True, "data": None, "error": None, "meta": None}
+    _ERR = {"success": False, "data": None, "error": None, "meta": None}
 
     def _ok(data: Any = None, meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        return _result(True, data=data, meta=meta)
+        result = _OK.copy()
+        result["data"] = data
+        result["meta"] = meta or {}
+        return result
 
     def _err(message: str, meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        return _result(False, error=message, meta=meta)
+        result = _ERR.copy()
+        result["error"] = message
+        result["meta"] = meta or {}
+        return result
 
     def _ensure_writes(tool: str) -> Optional[Dict[str, Any]]:
         if not resources.config.writes_enabled:
@@ -147,7 +181,7 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
         return _ok(data={"outstation": outstation_address, "class": event_class}, meta=meta)
 
     @server.tool()
-    async def list_points(ctx: Context) -> Dict[str, Any]:  # noqa: ARG001
+    def list_points(ctx: Context) -> Dict[str, Any]:  # noqa: ARG001
         return _ok(data={"points": resources.point_map.list(), "count": resources.point_map.count()})
 
     @server.tool()
@@ -180,7 +214,7 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
         return _err(f"Point type '{p_type}' not writable via alias")
 
     @server.tool()
-    async def ping(ctx: Context) -> Dict[str, Any]:
+    def ping(ctx: Context) -> Dict[str, Any]:
         return _ok(
             data={
                 "connection": _master(ctx).connection_status(),
@@ -6,15 +6,53 @@ import argparse
 import asyncio
 import json
 import os
-import random
 import signal
+import struct
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
+import numpy as np
 from rich.console import Console
 
+try:
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    msgpack = None
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None
+
 console = Console()
 
+# MessagePack frames carry a 4-byte big-endian length prefix. A JSON line never
+# starts with NUL, so a leading zero byte selects framed MessagePack.
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 1024 * 1024
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(message: Any) -> bytes:
+        return json.dumps(message).encode("utf-8")
+
+
+INVALID_JSON_RESPONSE = _dumps({"success": False, "error": "Invalid JSON"})
+
+
+def _pdo_bytes(data: Any) -> bytes:
+    """Bytes for a PDO write; values outside 0..255 keep only their low byte."""
+    if isinstance(data, list):
+        try:
+            return bytes(data)
+        except (TypeError, ValueError):
+            pass
+    return bytes([int(b) & 0xFF for b in data])
+
 
 def env(default: str, key: str) -> str:
     return os.getenv(key, default)
@@ -26,6 +64,8 @@ class MockConfig:
     port: int = int(env("6700", "MOCK_ETHERCAT_PORT"))
     update_interval: float = float(env("1.0", "MOCK_ETHERCAT_UPDATE_INTERVAL"))
     verbose: bool = env("false", "MOCK_ETHERCAT_VERBOSE").lower() in {"1", "true", "yes", "on"}
+    protocol: str = env("json", "MOCK_ETHERCAT_PROTOCOL")
+    unix_socket: str = env("", "MOCK_ETHERCAT_UNIX_SOCKET")
 
 
 @dataclass
@@ -36,7 +76,7 @@ class MockSlave:
     product_code: str
     revision: str
     state: str = "OP"
-    input_buffer: bytearray = field(default_factory=lambda: bytearray(b"\x00" * 8))
+    input_buffer: np.ndarray = field(default_factory=lambda: np.zeros(8, dtype=np.uint8))
     output_buffer: bytearray = field(default_factory=lambda: bytearray(b"\x00" * 8))
 
 
@@ -52,9 +92,25 @@ class EthercatMockServer:
                 revision="0x00010000",
             )
         }
+        self._rng = np.random.default_rng()
+        self._inputs = self._pack_inputs()
+        # Encoded scan response per codec. The slave set is fixed for the life of
+        # the server; clear this if slaves are ever added, removed or change state.
+        self._scan_cache: Dict[Callable[[Any], bytes], bytes] = {}
         self._server: Optional[asyncio.base_events.Server] = None
+        self._unix_server: Optional[asyncio.base_events.Server] = None
         self._running = False
 
+    def _pack_inputs(self) -> np.ndarray:
+        """Move every slave's input buffer into one (slaves, bytes) matrix of row views.
+
+        Reassign ``self._inputs`` from this after adding or removing slaves.
+        """
+        inputs = np.stack([slave.input_buffer for slave in self.slaves.values()])
+        for row, slave in zip(inputs, self.slaves.values()):
+            slave.input_buffer = row
+        return inputs
+
     async def start(self) -> None:
         if self._running:
             return
@@ -62,6 +118,10 @@ class EthercatMockServer:
         self._server = await asyncio.start_server(self._handle_client, self.config.host, self.config.port)
         addr = ", ".join(str(sock.getsockname()) for sock in self._server.sockets or [])
         console.print(f"[bold green]EtherCAT mock listening on {addr}[/bold green]")
+        if self.config.unix_socket:
+            # Same-host clients can skip the TCP loopback stack entirely.
+            self._unix_server = await asyncio.start_unix_server(self._handle_client, path=self.config.unix_socket)
+            console.print(f"[bold green]EtherCAT mock listening on {self.config.unix_socket}[/bold green]")
         asyncio.create_task(self._update_loop())
 
     async def stop(self) -> None:
@@ -69,13 +129,20 @@ class EthercatMockServer:
         if self._server:
             self._server.close()
             await self._server.wait_closed()
+        if self._unix_server:
+            self._unix_server.close()
+            await self._unix_server.wait_closed()
+            try:
+                os.unlink(self.config.unix_socket)
+            except FileNotFoundError:
+                pass
 
     async def _update_loop(self) -> None:
         while self._running:
             await asyncio.sleep(self.config.update_interval)
-            for slave in self.slaves.values():
-                for idx in range(len(slave.input_buffer)):
-                    slave.input_buffer[idx] = (slave.input_buffer[idx] + random.randint(0, 5)) & 0xFF
+            # One draw for every slave; uint8 addition wraps modulo 256 like the old per-byte & 0xFF.
+            inputs = self._inputs
+            inputs += self._rng.integers(0, 5, size=inputs.shape, dtype=np.uint8, endpoint=True)
             if self.config.verbose:
                 console.print("[cyan]Updated mock PDO data[/cyan]")
 
@@ -83,22 +150,56 @@ class EthercatMockServer:
         peer = writer.get_extra_info("peername")
         console.print(f"[yellow]Client connected {peer}[/yellow]")
         try:
-            while data := await reader.readline():
-                data = data.strip()
-                if not data:
-                    continue
-                try:
-                    request = json.loads(data)
-                except json.JSONDecodeError:
-                    await self._send(writer, {"success": False, "error": "Invalid JSON"})
-                    continue
-                response = self._dispatch(request)
-                await self._send(writer, response)
+            head = await reader.read(1)
+            if head == b"\x00" and self.config.protocol == "msgpack":
+                await self._serve_msgpack(reader, writer, head)
+            elif head:
+                await self._serve_json(reader, writer, head)
         finally:
             writer.close()
             await writer.wait_closed()
             console.print(f"[yellow]Client disconnected {peer}[/yellow]")
 
+    async def _serve_json(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, head: bytes) -> None:
+        data = head + await reader.readline()
+        while data:
+            data = data.strip()
+            if data:
+                try:
+                    request = _loads(data)
+                except json.JSONDecodeError:
+                    await self._send(writer, INVALID_JSON_RESPONSE)
+                else:
+                    await self._send(writer, self._respond(request, _dumps))
+            data = await reader.readline()
+
+    async def _serve_msgpack(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, head: bytes) -> None:
+        try:
+            while True:
+                header = head + await reader.readexactly(FRAME_HEADER.size - len(head))
+                head = b""
+                (size,) = FRAME_HEADER.unpack(header)
+                if size > MAX_FRAME_SIZE:
+                    await self._send_frame(writer, msgpack.packb({"success": False, "error": "Request too large"}))
+                    return
+                body = await reader.readexactly(size)
+                try:
+                    request = msgpack.unpackb(body, raw=False)
+                except Exception:
+                    await self._send_frame(writer, msgpack.packb({"success": False, "error": "Invalid MessagePack"}))
+                    continue
+                await self._send_frame(writer, self._respond(request, msgpack.packb))
+        except asyncio.IncompleteReadError:
+            return
+
+    def _respond(self, request: Dict[str, Any], encode: Callable[[Any], bytes]) -> bytes:
+        if request.get("op") == "scan":
+            body = self._scan_cache.get(encode)
+            if body is None:
+                body = self._scan_cache[encode] = encode(self._dispatch(request))
+            return body
+        return encode(self._dispatch(request))
+
     def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
         op = request.get("op")
         if op == "scan":
@@ -122,7 +223,7 @@ class EthercatMockServer:
             slave = self.slaves.get(pos)
             if not slave:
                 return {"success": False, "error": "Slave not found"}
-            payload = bytes(slave.input_buffer[:length])
+            payload = slave.input_buffer[:length].tobytes()
             return {"success": True, "data": {"raw_data_hex": payload.hex(), "position": pos}}
         if op == "write_pdo":
             pos = int(request.get("position", 0))
@@ -130,13 +231,17 @@ class EthercatMockServer:
             slave = self.slaves.get(pos)
             if not slave:
                 return {"success": False, "error": "Slave not found"}
-            payload = bytes(int(b) & 0xFF for b in data)
+            payload = _pdo_bytes(data)
             slave.output_buffer[: len(payload)] = payload
             return {"success": True, "data": {"written_bytes": len(payload)}}
         return {"success": False, "error": f"Unknown op '{op}'"}
 
-    async def _send(self, writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
-        writer.write(json.dumps(message).encode("utf-8") + b"\n")
+    async def _send(self, writer: asyncio.StreamWriter, body: bytes) -> None:
+        writer.writelines((body, b"\n"))
+        await writer.drain()
+
+    async def _send_frame(self, writer: asyncio.StreamWriter, body: bytes) -> None:
+        writer.writelines((FRAME_HEADER.pack(len(body)), body))
         await writer.drain()
 
 
@@ -146,6 +251,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--port", type=int, default=int(env("6700", "MOCK_ETHERCAT_PORT")))
     parser.add_argument("--update-interval", type=float, default=float(env("1.0", "MOCK_ETHERCAT_UPDATE_INTERVAL")))
     parser.add_argument("--verbose", action="store_true", default=env("false", "MOCK_ETHERCAT_VERBOSE").lower() in {"1", "true", "yes", "on"})
+    parser.add_argument(
+        "--protocol",
+        choices=("json", "msgpack"),
+        default=env("json", "MOCK_ETHERCAT_PROTOCOL"),
+        help="msgpack also accepts length-prefixed MessagePack frames; JSON lines keep working",
+    )
+    parser.add_argument(
+        "--unix-socket",
+        default=env("", "MOCK_ETHERCAT_UNIX_SOCKET"),
+        help="also listen on this Unix domain socket path",
+    )
     return parser.parse_args()
 
 
@@ -172,7 +288,16 @@ async def run_server(config: MockConfig) -> None:
 
 def main() -> None:
     args = parse_args()
-    config = MockConfig(host=args.host, port=args.port, update_interval=args.update_interval, verbose=args.verbose)
+    config = MockConfig(
+        host=args.host,
+        port=args.port,
+        update_interval=args.update_interval,
+        verbose=args.verbose,
+        protocol=args.protocol,
+        unix_socket=args.unix_socket,
+    )
+    if config.protocol == "msgpack" and msgpack is None:
+        raise SystemExit("--protocol msgpack requires the msgpack package (install the 'msgpack' extra)")
     asyncio.run(run_server(config))
 
 
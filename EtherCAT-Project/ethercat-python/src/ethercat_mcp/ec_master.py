@@ -6,7 +6,7 @@ import os
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import anyio
 
@@ -15,6 +15,8 @@ try:
 except Exception:  # pragma: no cover - runtime guard
     pysoem = None
 
+T = TypeVar("T")
+
 
 def _env_bool(name: str, default: bool) -> bool:
     val = os.getenv(name)
@@ -33,6 +35,8 @@ class EthercatConfig:
     retry_backoff_base: float = float(os.getenv("ETHERCAT_RETRY_BACKOFF_BASE", "0.1"))
     writes_enabled: bool = _env_bool("ETHERCAT_WRITES_ENABLED", True)
     state_change_enabled: bool = _env_bool("ETHERCAT_STATE_CHANGE_ENABLED", False)
+    max_workers: int = int(os.getenv("ETHERCAT_MAX_WORKERS", "4"))
+    scan_cache_ttl_ms: int = int(os.getenv("ETHERCAT_SCAN_CACHE_TTL_MS", "500"))
 
 
 class EthercatMasterError(RuntimeError):
@@ -44,41 +48,36 @@ class EthercatMaster:
 
     def __init__(self, config: Optional[EthercatConfig] = None) -> None:
         self.config = config or EthercatConfig()
+        # Guards open/close and the scanned slave list; see _slave_lock() for the rest.
         self._lock = threading.RLock()
+        self._slave_locks: Dict[int, threading.Lock] = {}
+        self._limiter: Optional[anyio.CapacityLimiter] = None
+        # (devices, meta, time.monotonic() of the scan) from the last bus probe.
+        self._scan_cache: Optional[Tuple[List[Dict[str, Any]], Dict[str, Any], float]] = None
         self._master: Optional[Any] = None
         self._slaves: List[Any] = []
         self._opened = False
 
     async def ensure_open(self) -> None:
-        await anyio.to_thread.run_sync(self._open_master)
+        # Every tool call lands here; once open, skip the worker-thread round trip.
+        # _open_master re-checks under the lock, so a stale read only costs one hop.
+        if self._opened:
+            return
+        await self._run(self._open_master)
 
     async def close(self) -> None:
-        await anyio.to_thread.run_sync(self._close_master)
+        self._scan_cache = None
+        await self._run(self._close_master)
 
     async def scan_slaves(self) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        # config_init() probes the whole bus; repeat calls inside the TTL reuse the last result.
+        cached = self._scan_cache
+        if cached is not None and (time.monotonic() - cached[2]) * 1000.0 < self.config.scan_cache_ttl_ms:
+            return cached[0], {**cached[1], "cached": True}
         await self.ensure_open()
-        start = time.perf_counter()
-        with self._lock:
-            if not self._master:
-                raise EthercatMasterError("Master not initialized")
-            self._master.config_init()
-            self._slaves = list(self._master.slaves)
-            devices = [
-                {
-                    "position": idx,
-                    "name": slave.name,
-                    "state": slave.state,
-                    "vendor_id": hex(slave.man),
-                    "product_code": hex(slave.id),
-                    "revision": hex(getattr(slave, "rev", 0)),
-                    "serial": getattr(slave, "serial", None),
-                    "input_size": slave.input,
-                    "output_size": slave.output,
-                }
-                for idx, slave in enumerate(self._slaves)
-            ]
-        duration = (time.perf_counter() - start) * 1000.0
-        return devices, {"duration_ms": round(duration, 3), "count": len(devices)}
+        devices, meta = await self._run(self._do_scan_slaves)
+        self._scan_cache = (devices, meta, time.monotonic())
+        return devices, meta
 
     async def get_slave(self, position: int) -> Any:
         await self.ensure_open()
@@ -87,31 +86,106 @@ class EthercatMaster:
                 raise EthercatMasterError(f"Slave at position {position} not found")
             return self._slaves[position]
 
+    async def get_slave_info(self, position: int) -> Dict[str, Any]:
+        # Describe one slave from the last scan; only probe the bus if nothing was scanned yet.
+        if not self._slaves:
+            await self.scan_slaves()
+        return self._describe_slave(position, await self.get_slave(position))
+
     async def read_pdo(self, slave_position: int, offset: int, length: int) -> Tuple[bytes, Dict[str, Any]]:
         await self.ensure_open()
+        return await self._run(self._do_read_pdo, slave_position, offset, length)
+
+    async def write_pdo(self, slave_position: int, offset: int, data: bytes) -> Dict[str, Any]:
+        if not self.config.writes_enabled:
+            raise EthercatMasterError("Write operations are disabled")
+        await self.ensure_open()
+        return await self._run(self._do_write_pdo, slave_position, offset, data)
+
+    async def read_sdo(self, slave_position: int, index: int, subindex: int) -> Tuple[Any, Dict[str, Any]]:
+        await self.ensure_open()
+        return await self._run(self._do_read_sdo, slave_position, index, subindex)
+
+    async def write_sdo(self, slave_position: int, index: int, subindex: int, value: Any) -> Dict[str, Any]:
+        if not self.config.writes_enabled:
+            raise EthercatMasterError("Write operations are disabled")
+        await self.ensure_open()
+        self._scan_cache = None
+        return await self._run(self._do_write_sdo, slave_position, index, subindex, value)
+
+    async def set_slave_state(self, slave_position: int, state: int) -> Dict[str, Any]:
+        if not self.config.state_change_enabled:
+            raise EthercatMasterError("State changes are disabled (set ETHERCAT_STATE_CHANGE_ENABLED=true)")
+        await self.ensure_open()
+        self._scan_cache = None
+        return await self._run(self._do_set_slave_state, slave_position, state)
+
+    def connection_status(self) -> Dict[str, Any]:
+        return {
+            "interface": self.config.interface,
+            "cycle_time_us": self.config.cycle_time_us,
+            "timeout_us": self.config.timeout_us,
+            "writes_enabled": self.config.writes_enabled,
+            "state_change_enabled": self.config.state_change_enabled,
+            "slaves": len(self._slaves),
+        }
+
+    # -----------------------------
+    # Internal helpers
+    # -----------------------------
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        # Blocking PySOEM work runs in worker threads, at most max_workers at a time.
+        # The limiter is created lazily because it must belong to the running loop.
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(max(self.config.max_workers, 1))
+        return await anyio.to_thread.run_sync(func, *args, limiter=self._limiter)
+
+    def _do_scan_slaves(self) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         start = time.perf_counter()
         with self._lock:
+            if not self._master:
+                raise EthercatMasterError("Master not initialized")
+            self._master.config_init()
+            self._slaves = list(self._master.slaves)
+            devices = [self._describe_slave(idx, slave) for idx, slave in enumerate(self._slaves)]
+        duration = (time.perf_counter() - start) * 1000.0
+        return devices, {"duration_ms": round(duration, 3), "count": len(devices)}
+
+    @staticmethod
+    def _describe_slave(position: int, slave: Any) -> Dict[str, Any]:
+        return {
+            "position": position,
+            "name": slave.name,
+            "state": slave.state,
+            "vendor_id": hex(slave.man),
+            "product_code": hex(slave.id),
+            "revision": hex(getattr(slave, "rev", 0)),
+            "serial": getattr(slave, "serial", None),
+            "input_size": slave.input,
+            "output_size": slave.output,
+        }
+
+    def _do_read_pdo(self, slave_position: int, offset: int, length: int) -> Tuple[bytes, Dict[str, Any]]:
+        start = time.perf_counter()
+        with self._slave_lock(slave_position):
             # Placeholder: PySOEM cyclic data is handled via processdata
             # For now, return zeroed bytes of requested length.
             data = bytes([0] * length)
         duration = (time.perf_counter() - start) * 1000.0
         return data, {"duration_ms": round(duration, 3), "slave_position": slave_position}
 
-    async def write_pdo(self, slave_position: int, offset: int, data: bytes) -> Dict[str, Any]:
-        if not self.config.writes_enabled:
-            raise EthercatMasterError("Write operations are disabled")
-        await self.ensure_open()
+    def _do_write_pdo(self, slave_position: int, offset: int, data: bytes) -> Dict[str, Any]:
         start = time.perf_counter()
-        with self._lock:
+        with self._slave_lock(slave_position):
             # Placeholder: writing would involve updating output buffers and sending process data
             pass
         duration = (time.perf_counter() - start) * 1000.0
         return {"duration_ms": round(duration, 3), "slave_position": slave_position, "written_bytes": len(data)}
 
-    async def read_sdo(self, slave_position: int, index: int, subindex: int) -> Tuple[Any, Dict[str, Any]]:
-        await self.ensure_open()
+    def _do_read_sdo(self, slave_position: int, index: int, subindex: int) -> Tuple[Any, Dict[str, Any]]:
         start = time.perf_counter()
-        with self._lock:
+        with self._slave_lock(slave_position):
             value = {
                 "index": hex(index),
                 "subindex": subindex,
@@ -120,12 +194,9 @@ class EthercatMaster:
         duration = (time.perf_counter() - start) * 1000.0
         return value, {"duration_ms": round(duration, 3), "slave_position": slave_position}
 
-    async def write_sdo(self, slave_position: int, index: int, subindex: int, value: Any) -> Dict[str, Any]:
-        if not self.config.writes_enabled:
-            raise EthercatMasterError("Write operations are disabled")
-        await self.ensure_open()
+    def _do_write_sdo(self, slave_position: int, index: int, subindex: int, value: Any) -> Dict[str, Any]:
         start = time.perf_counter()
-        with self._lock:
+        with self._slave_lock(slave_position):
             # Placeholder for pysoem.sdo_write
             pass
         duration = (time.perf_counter() - start) * 1000.0
@@ -136,30 +207,21 @@ class EthercatMaster:
             "subindex": subindex,
         }
 
-    async def set_slave_state(self, slave_position: int, state: int) -> Dict[str, Any]:
-        if not self.config.state_change_enabled:
-            raise EthercatMasterError("State changes are disabled (set ETHERCAT_STATE_CHANGE_ENABLED=true)")
-        await self.ensure_open()
+    def _do_set_slave_state(self, slave_position: int, state: int) -> Dict[str, Any]:
         start = time.perf_counter()
-        with self._lock:
+        with self._slave_lock(slave_position):
             # Placeholder: set desired slave.state and call write_state
             pass
         duration = (time.perf_counter() - start) * 1000.0
         return {"duration_ms": round(duration, 3), "slave_position": slave_position, "state": state}
 
-    def connection_status(self) -> Dict[str, Any]:
-        return {
-            "interface": self.config.interface,
-            "cycle_time_us": self.config.cycle_time_us,
-            "timeout_us": self.config.timeout_us,
-            "writes_enabled": self.config.writes_enabled,
-            "state_change_enabled": self.config.state_change_enabled,
-            "slaves": len(self._slaves),
-        }
-
-    # -----------------------------
-    # Internal helpers
-    # -----------------------------
+    def _slave_lock(self, position: int) -> threading.Lock:
+        # SOEM serialises frame I/O on the port itself, so mailbox/PDO work on
+        # different slaves may overlap; only same-slave operations are ordered.
+        lock = self._slave_locks.get(position)
+        if lock is None:
+            lock = self._slave_locks.setdefault(position, threading.Lock())
+        return lock
 
     def _open_master(self) -> None:
         if pysoem is None:  # pragma: no cover - platform guard
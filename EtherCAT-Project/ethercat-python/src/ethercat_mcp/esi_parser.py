@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from lxml import etree
 
@@ -14,8 +14,11 @@ class ESIParserError(RuntimeError):
 
 
 class ESIParser:
-    def __init__(self, base_path: Optional[Path | str] = None) -> None:
+    def __init__(self, base_path: Optional[Path | str] = None, cache_size: int = 64) -> None:
         self.base_path = Path(base_path).expanduser() if base_path else None
+        self.cache_size = cache_size
+        # Resolved path -> (st_mtime_ns, parsed ESI), least recently used first.
+        self._cache: OrderedDict[str, Tuple[int, Dict[str, Any]]] = OrderedDict()
 
     def _resolve(self, filepath: str | Path) -> Path:
         path = Path(filepath).expanduser()
@@ -29,18 +32,28 @@ class ESIParser:
 
     def load(self, filepath: str | Path) -> Dict[str, Any]:
         path = self._resolve(filepath)
+        object_dictionary: List[Dict[str, Any]] = []
+        pdos: Dict[str, List[Dict[str, Any]]] = {"tx": [], "rx": []}
+        # One streaming pass over the file; each matched element is discarded once
+        # converted so large vendor ESIs never sit in memory as a full tree.
+        context = etree.iterparse(str(path), events=("end",), tag=("Object", "TxPdo", "RxPdo"))
         try:
-            tree = etree.parse(str(path))
+            for _, elem in context:
+                if elem.tag == "Object":
+                    object_dictionary.append(self._parse_object(elem))
+                else:
+                    pdos["tx" if elem.tag == "TxPdo" else "rx"].append(self._parse_pdo(elem))
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
         except Exception as exc:
             raise ESIParserError(f"Failed to parse ESI file {path}: {exc}") from exc
-        root = tree.getroot()
+        root = context.root
         metadata = {
             "vendor": root.attrib.get("Vendor"),
             "name": root.attrib.get("Name"),
             "revision": root.attrib.get("Revision"),
         }
-        object_dictionary = self._parse_object_dictionary(root)
-        pdos = self._parse_pdos(root)
         return {
             "filepath": str(path),
             "metadata": metadata,
@@ -48,51 +61,48 @@ class ESIParser:
             "pdos": pdos,
         }
 
-    def _parse_object_dictionary(self, root: etree._Element) -> List[Dict[str, Any]]:
-        entries: List[Dict[str, Any]] = []
-        for obj in root.findall(".//Object"):
-            entries.append(
+    def _parse_object(self, obj: etree._Element) -> Dict[str, Any]:
+        return {
+            "index": obj.attrib.get("Index"),
+            "name": obj.attrib.get("Name"),
+            "type": obj.attrib.get("Type"),
+            "subindexes": [
                 {
-                    "index": obj.attrib.get("Index"),
-                    "name": obj.attrib.get("Name"),
-                    "type": obj.attrib.get("Type"),
-                    "subindexes": [
-                        {
-                            "subindex": sub.attrib.get("SubIndex"),
-                            "name": sub.attrib.get("Name"),
-                            "bit_length": sub.attrib.get("BitLen"),
-                        }
-                        for sub in obj.findall(".//SubItem")
-                    ],
+                    "subindex": sub.attrib.get("SubIndex"),
+                    "name": sub.attrib.get("Name"),
+                    "bit_length": sub.attrib.get("BitLen"),
                 }
-            )
-        return entries
+                for sub in obj.iter("SubItem")
+            ],
+        }
 
-    def _parse_pdos(self, root: etree._Element) -> Dict[str, List[Dict[str, Any]]]:
-        pdos = {"tx": [], "rx": []}
-        for direction, key in [("TxPdo", "tx"), ("RxPdo", "rx")]:
-            entries = root.findall(f".//{direction}")
-            parsed: List[Dict[str, Any]] = []
-            for pdo in entries:
-                mapped = [
-                    {
-                        "index": entry.attrib.get("Index"),
-                        "subindex": entry.attrib.get("SubIndex"),
-                        "bit_length": entry.attrib.get("BitLen"),
-                        "name": entry.attrib.get("Name"),
-                    }
-                    for entry in pdo.findall(".//Entry")
-                ]
-                parsed.append(
-                    {
-                        "index": pdo.attrib.get("Index"),
-                        "name": pdo.attrib.get("Name"),
-                        "entries": mapped,
-                    }
-                )
-            pdos[key] = parsed
-        return pdos
+    def _parse_pdo(self, pdo: etree._Element) -> Dict[str, Any]:
+        return {
+            "index": pdo.attrib.get("Index"),
+            "name": pdo.attrib.get("Name"),
+            "entries": [
+                {
+                    "index": entry.attrib.get("Index"),
+                    "subindex": entry.attrib.get("SubIndex"),
+                    "bit_length": entry.attrib.get("BitLen"),
+                    "name": entry.attrib.get("Name"),
+                }
+                for entry in pdo.iter("Entry")
+            ],
+        }
 
-    @lru_cache(maxsize=64)
     def load_cached(self, filepath: str | Path) -> Dict[str, Any]:
-        return self.load(filepath)
+        # Absolute, symlink-free path, so every spelling of the same file shares one entry.
+        path = self._resolve(filepath).resolve()
+        key = str(path)
+        mtime = path.stat().st_mtime_ns
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            self._cache.move_to_end(key)
+            return cached[1]
+        data = self.load(path)
+        self._cache[key] = (mtime, data)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return data
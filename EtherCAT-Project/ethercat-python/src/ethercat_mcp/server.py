@@ -26,7 +26,7 @@ class EthercatMCPServer:
     ) -> None:
         self.master = master or EthercatMaster()
         self.tool_config = tool_config or ToolConfig.from_env()
-        self.slave_map = SlaveMap(self.tool_config.slave_map_path)
+        self.slave_map = SlaveMap(self.tool_config.slave_map_path, self.tool_config.slave_map_stat_interval_ms)
         self.esi_parser = ESIParser(self.tool_config.esi_base_path)
         self._server = FastMCP(
             name="EtherCAT MCP Server",
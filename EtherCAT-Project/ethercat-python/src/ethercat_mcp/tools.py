@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from mcp.server.fastmcp import Context, FastMCP
 
@@ -21,11 +23,31 @@ def _env_bool(name: str, default: bool) -> bool:
     return val.strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+_STATE_MAP = {"INIT": 1, "PREOP": 2, "SAFEOP": 4, "OP": 8}
+
+
+@lru_cache(maxsize=1024)
+def _parse_index(index: str) -> int:
+    # Polling clients repeat the same handful of object indexes ("0x6000", ...).
+    return int(index, 0)
+
+
+def _pdo_bytes(data: Any) -> bytes:
+    """Bytes for a PDO write; values outside 0..255 keep only their low byte."""
+    if isinstance(data, list):
+        try:
+            return bytes(data)
+        except (TypeError, ValueError):
+            pass
+    return bytes([int(b) & 0xFF for b in data])
+
+
 @dataclass(slots=True)
 class ToolConfig:
     writes_enabled: bool = True
     state_change_enabled: bool = False
     slave_map_path: Optional[Path] = None
+    slave_map_stat_interval_ms: int = 500
     esi_base_path: Optional[Path] = None
 
     @classmethod
@@ -36,39 +58,54 @@ class ToolConfig:
             writes_enabled=_env_bool("ETHERCAT_WRITES_ENABLED", True),
             state_change_enabled=_env_bool("ETHERCAT_STATE_CHANGE_ENABLED", False),
             slave_map_path=Path(slave_path).expanduser() if slave_path else None,
+            slave_map_stat_interval_ms=int(os.getenv("SLAVE_MAP_STAT_INTERVAL_MS", "500")),
             esi_base_path=Path(esi_path).expanduser() if esi_path else None,
         )
 
 
 class SlaveMap:
-    def __init__(self, path: Optional[Path]) -> None:
+    __slots__ = ("path", "_stat_interval_ns", "_last_stat_ns", "_slaves", "_mtime", "_list_cache")
+
+    def __init__(self, path: Optional[Path], stat_interval_ms: int = 500) -> None:
         self.path = path
+        self._stat_interval_ns = max(0, stat_interval_ms) * 1_000_000
+        self._last_stat_ns = 0
         self._slaves: Dict[str, Dict[str, Any]] = {}
-        self._mtime: Optional[float] = None
+        self._mtime: Optional[int] = None  # st_mtime_ns of the loaded file
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
         self.refresh()
 
     def refresh(self) -> None:
         if not self.path:
             self._slaves = {}
+            self._list_cache = None
             self._mtime = None
             return
+        # Alias tools refresh on every call; stat() the file at most once per interval.
+        now = time.monotonic_ns()
+        if self._mtime is not None and now - self._last_stat_ns < self._stat_interval_ns:
+            return
+        self._last_stat_ns = now
         try:
             stat = self.path.stat()
         except FileNotFoundError:
             self._slaves = {}
+            self._list_cache = None
             self._mtime = None
             return
-        if self._mtime and stat.st_mtime <= self._mtime:
+        if self._mtime is not None and stat.st_mtime_ns <= self._mtime:
             return
         try:
             with self.path.open("r", encoding="utf-8") as fh:
                 data = json.load(fh)
             if isinstance(data, dict):
                 self._slaves = {str(alias): spec for alias, spec in data.items()}
-                self._mtime = stat.st_mtime
+                self._list_cache = None
+                self._mtime = stat.st_mtime_ns
         except Exception:
             self._slaves = {}
-            self._mtime = stat.st_mtime
+            self._list_cache = None
+            self._mtime = stat.st_mtime_ns
 
     def get(self, alias: str) -> Optional[Dict[str, Any]]:
         self.refresh()
@@ -76,15 +113,18 @@ class SlaveMap:
 
     def list(self) -> List[Dict[str, Any]]:
         self.refresh()
-        return [
-            {
-                "alias": alias,
-                "position": spec.get("position"),
-                "description": spec.get("description"),
-                "vendor_id": spec.get("vendor_id"),
-            }
-            for alias, spec in self._slaves.items()
-        ]
+        # Rebuilt only after refresh() loads a new version of the file.
+        if self._list_cache is None:
+            self._list_cache = [
+                {
+                    "alias": alias,
+                    "position": spec.get("position"),
+                    "description": spec.get("description"),
+                    "vendor_id": spec.get("vendor_id"),
+                }
+                for alias, spec in self._slaves.items()
+            ]
+        return self._list_cache
 
     def count(self) -> int:
         self.refresh()
@@ -133,12 +173,10 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
     @server.tool()
     async def get_slave_info(ctx: Context, slave_position: int) -> Dict[str, Any]:
         try:
-            devices, _ = await _master(ctx).scan_slaves()
+            info = await _master(ctx).get_slave_info(slave_position)
         except Exception as exc:
             return _err(str(exc), {"slave_position": slave_position})
-        if slave_position >= len(devices):
-            return _err("Slave position out of range", {"slave_position": slave_position})
-        return _ok(data=devices[slave_position])
+        return _ok(data=info)
 
     @server.tool()
     async def read_pdo(ctx: Context, slave_position: int, offset: int, length: int) -> Dict[str, Any]:
@@ -152,11 +190,15 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
         )
 
     @server.tool()
-    async def write_pdo(ctx: Context, slave_position: int, offset: int, data: List[int]) -> Dict[str, Any]:
+    async def write_pdo(ctx: Context, slave_position: int, offset: int, data: Union[List[int], str]) -> Dict[str, Any]:
         guard = _ensure_writes("write_pdo")
         if guard:
             return guard
-        payload = bytes(int(b) & 0xFF for b in data)
+        # A hex string (as returned by read_pdo) skips the per-byte list entirely.
+        try:
+            payload = bytes.fromhex(data) if isinstance(data, str) else _pdo_bytes(data)
+        except ValueError as exc:
+            return _err(f"Invalid PDO data: {exc}", {"slave_position": slave_position})
         try:
             meta = await _master(ctx).write_pdo(slave_position, offset, payload)
         except Exception as exc:
@@ -165,7 +207,7 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
 
     @server.tool()
     async def read_sdo(ctx: Context, slave_position: int, index: str, subindex: int) -> Dict[str, Any]:
-        idx_int = int(index, 0)
+        idx_int = _parse_index(index)
         try:
             value, meta = await _master(ctx).read_sdo(slave_position, idx_int, subindex)
         except Exception as exc:
@@ -177,7 +219,7 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
         guard = _ensure_writes("write_sdo")
         if guard:
             return guard
-        idx_int = int(index, 0)
+        idx_int = _parse_index(index)
         try:
             meta = await _master(ctx).write_sdo(slave_position, idx_int, subindex, value)
         except Exception as exc:
@@ -189,8 +231,7 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
         guard = _ensure_state_changes("set_slave_state")
         if guard:
             return guard
-        state_map = {"INIT": 1, "PREOP": 2, "SAFEOP": 4, "OP": 8}
-        desired = state_map.get(state.upper())
+        desired = _STATE_MAP.get(state.upper())
         if desired is None:
             return _err("Invalid state (expected INIT, PREOP, SAFEOP, OP)", {"state": state})
         try:
@@ -221,7 +262,7 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
         return await read_pdo(ctx, position, offset, length)
 
     @server.tool()
-    async def write_slave_by_alias(ctx: Context, alias: str, data: List[int]) -> Dict[str, Any]:
+    async def write_slave_by_alias(ctx: Context, alias: str, data: Union[List[int], str]) -> Dict[str, Any]:
         guard = _ensure_writes("write_slave_by_alias")
         if guard:
             return guard
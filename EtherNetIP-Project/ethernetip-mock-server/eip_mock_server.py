@@ -5,32 +5,77 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
+import logging
 import os
-import random
+import re
 import signal
+import struct
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 
+try:
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    msgpack = None
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None
+
+try:
+    import uvloop  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    uvloop = None
+
 console = Console()
+logger = logging.getLogger("eip_mock_server")
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+
+    def _loads(data: Any) -> Any:
+        return json.loads(bytes(data))
+
+    def _dumps(message: Any) -> bytes:
+        return json.dumps(message).encode("utf-8")
+
+
+# MessagePack frames: 4-byte big-endian body length, then the body.
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 1024 * 1024
+RECV_BUFFER_SIZE = 64 * 1024
+MAX_REQUEST_SIZE = 1024 * 1024
+_NON_BLANK = re.compile(rb"\S")
+
+INVALID_JSON_RESPONSE = _dumps({"success": False, "error": "Invalid JSON"})
+
+
+_BOOL_TRUE = frozenset({"1", "true", "yes", "on"})
 
 
 def env(default: str, key: str) -> str:
     return os.getenv(key, default)
 
 
-@dataclass
+# Defaults are factories so the environment is read when a config is built, not at import.
+@dataclass(slots=True)
 class MockConfig:
-    host: str = env("127.0.0.1", "MOCK_ENIP_HOST")
-    port: int = int(env("5025", "MOCK_ENIP_PORT"))
-    update_interval: float = float(env("1.5", "MOCK_ENIP_UPDATE_INTERVAL"))
-    verbose: bool = env("false", "MOCK_ENIP_VERBOSE").lower() in {"1", "true", "yes", "on"}
+    host: str = field(default_factory=lambda: env("127.0.0.1", "MOCK_ENIP_HOST"))
+    port: int = field(default_factory=lambda: int(env("5025", "MOCK_ENIP_PORT")))
+    update_interval: float = field(default_factory=lambda: float(env("1.5", "MOCK_ENIP_UPDATE_INTERVAL")))
+    verbose: bool = field(default_factory=lambda: env("false", "MOCK_ENIP_VERBOSE").lower() in _BOOL_TRUE)
+    protocol: str = field(default_factory=lambda: env("json", "MOCK_ENIP_PROTOCOL"))
 
 
-@dataclass
+@dataclass(slots=True)
 class TagEntry:
     name: str
     value: Any
@@ -39,11 +84,15 @@ class TagEntry:
     mutable: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TagDatabase:
     tags: Dict[str, TagEntry] = field(default_factory=dict)
+    # Bumped on every change to tag values so cached responses can tell they are stale.
+    version: int = field(default=0, init=False)
+    _rng: np.random.Generator = field(default_factory=np.random.default_rng, init=False, repr=False)
 
     def seed_defaults(self) -> None:
+        self.version += 1
         self.tags = {
             "Program:MainProgram.MotorSpeed": TagEntry("Program:MainProgram.MotorSpeed", 1450.0, "REAL", "Motor speed RPM"),
             "Program:MainProgram.MotorTorque": TagEntry("Program:MainProgram.MotorTorque", 38.0, "REAL"),
@@ -64,20 +113,143 @@ class TagDatabase:
         if not entry.mutable:
             raise ValueError(f"Tag '{tag}' is read-only")
         entry.value = value
+        self.version += 1
         return entry
 
     def randomize(self) -> None:
-        if "Program:MainProgram.MotorSpeed" in self.tags:
-            base = 1450.0
-            self.tags["Program:MainProgram.MotorSpeed"].value = base + random.uniform(-50, 50)
-        if "Program:MainProgram.MotorTorque" in self.tags:
-            self.tags["Program:MainProgram.MotorTorque"].value = 35.0 + random.uniform(-5, 5)
-        if "Program:MainProgram.Conveyor_Status.Running" in self.tags:
-            self.tags["Program:MainProgram.Conveyor_Status.Running"].value = random.random() > 0.3
-        if "Program:MainProgram.Tank_Levels" in self.tags:
-            self.tags["Program:MainProgram.Tank_Levels"].value = [
-                30.0 + random.uniform(-3, 3) for _ in self.tags["Program:MainProgram.Tank_Levels"].value
-            ]
+        self.version += 1
+        tags = self.tags
+        levels = tags.get("Program:MainProgram.Tank_Levels")
+        n_levels = len(levels.value) if levels is not None else 0
+        # One draw in [0, 1) covers motor speed, torque, the conveyor flag and every tank level.
+        u = self._rng.random(3 + n_levels)
+        if (entry := tags.get("Program:MainProgram.MotorSpeed")) is not None:
+            entry.value = 1400.0 + 100.0 * float(u[0])
+        if (entry := tags.get("Program:MainProgram.MotorTorque")) is not None:
+            entry.value = 30.0 + 10.0 * float(u[1])
+        if (entry := tags.get("Program:MainProgram.Conveyor_Status.Running")) is not None:
+            entry.value = bool(u[2] > 0.3)
+        if levels is not None:
+            levels.value = (27.0 + 6.0 * u[3:]).tolist()
+
+
+class _ClientProtocol(asyncio.BufferedProtocol):
+    """Bridge connection that receives JSON lines or MessagePack frames into a reused buffer."""
+
+    def __init__(self, server: "MockEtherNetIPServer") -> None:
+        self._server = server
+        self._buf = bytearray(RECV_BUFFER_SIZE)
+        self._used = 0
+        self._scanned = 0
+        self._framed: Optional[bool] = None
+        self._transport: Optional[asyncio.Transport] = None
+        self._peer: Any = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+        self._peer = transport.get_extra_info("peername")
+        if self._server.config.verbose:
+            logger.info("Client connected %s", self._peer)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._transport = None
+        if self._server.config.verbose:
+            logger.info("Client disconnected %s", self._peer)
+
+    def pause_writing(self) -> None:
+        # The client is not reading its replies; stop taking requests until the transport drains.
+        if self._transport is not None:
+            self._transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        if self._transport is not None:
+            self._transport.resume_reading()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._used == len(self._buf):
+            # The previous view may still be exported, so grow into a new buffer.
+            grown = bytearray(len(self._buf) * 2)
+            grown[: self._used] = self._buf
+            self._buf = grown
+        return memoryview(self._buf)[self._used :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._used += nbytes
+        if self._framed is None:
+            # The first byte picks the wire format for the rest of the connection.
+            self._framed = self._buf[0] == 0 and self._server.config.protocol == "msgpack"
+        start = self._consume_frames() if self._framed else self._consume_lines()
+        if start:
+            # Same-size slice assignment is allowed while a view is exported.
+            remaining = self._used - start
+            self._buf[:remaining] = self._buf[start : self._used]
+            self._used = remaining
+        self._scanned = self._used
+        if not self._framed and self._used >= MAX_REQUEST_SIZE and self._transport is not None:
+            self._send({"success": False, "error": "Request too large"})
+            self._transport.close()
+
+    def _consume_lines(self) -> int:
+        buf = self._buf
+        view = memoryview(buf)
+        start = 0
+        # Resume the delimiter search where the previous one stopped so a
+        # request arriving in many segments is only scanned once.
+        scan = self._scanned
+        while (end := buf.find(b"\n", scan, self._used)) != -1:
+            # Parse straight out of the receive buffer; blank lines are skipped.
+            first = _NON_BLANK.search(buf, start, end)
+            start = scan = end + 1
+            if first is not None:
+                self._handle_line(view[first.start() : end])
+        return start
+
+    def _consume_frames(self) -> int:
+        buf = self._buf
+        view = memoryview(buf)
+        start = 0
+        while self._used - start >= FRAME_HEADER.size:
+            (size,) = FRAME_HEADER.unpack_from(buf, start)
+            if size > MAX_FRAME_SIZE:
+                self._send_frame({"success": False, "error": "Request too large"})
+                if self._transport is not None:
+                    self._transport.close()
+                return self._used
+            end = start + FRAME_HEADER.size + size
+            if end > self._used:
+                break
+            self._handle_frame(view[start + FRAME_HEADER.size : end])
+            start = end
+        return start
+
+    def _handle_line(self, line: memoryview) -> None:
+        try:
+            request = _loads(line)
+        except json.JSONDecodeError:
+            self._send(INVALID_JSON_RESPONSE)
+            return
+        self._send(self._server._respond(request, _dumps))
+
+    def _handle_frame(self, body: memoryview) -> None:
+        try:
+            request = msgpack.unpackb(body, raw=False)
+        except Exception:
+            self._send_frame({"success": False, "error": "Invalid MessagePack"})
+            return
+        self._send_frame(self._server._respond(request, msgpack.packb))
+
+    def _send(self, message: Union[Dict[str, Any], bytes]) -> None:
+        if self._transport is None or self._transport.is_closing():
+            return
+        body = message if isinstance(message, bytes) else _dumps(message)
+        # writelines lets the transport send body and delimiter without concatenating them.
+        self._transport.writelines((body, b"\n"))
+
+    def _send_frame(self, message: Union[Dict[str, Any], bytes]) -> None:
+        if self._transport is None or self._transport.is_closing():
+            return
+        body = message if isinstance(message, bytes) else msgpack.packb(message)
+        self._transport.writelines((FRAME_HEADER.pack(len(body)), body))
 
 
 class MockEtherNetIPServer:
@@ -85,84 +257,118 @@ class MockEtherNetIPServer:
         self.config = config
         self.tags = TagDatabase()
         self.tags.seed_defaults()
+        self._ops: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "read": self._op_read,
+            "write": self._op_write,
+            "read_many": self._op_read_many,
+            "write_many": self._op_write_many,
+            "list": self._op_list,
+        }
+        # Encoded "list" responses per encoder, valid while tags.version == _list_version.
+        self._list_cache: Dict[Callable[[Any], bytes], bytes] = {}
+        self._list_version = -1
         self._server: Optional[asyncio.base_events.Server] = None
+        self._timer_handle: Optional[asyncio.TimerHandle] = None
         self._running = False
 
     async def start(self) -> None:
         if self._running:
             return
         self._running = True
-        self._server = await asyncio.start_server(self._handle_client, self.config.host, self.config.port)
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: _ClientProtocol(self), self.config.host, self.config.port)
         addr = ", ".join(str(sock.getsockname()) for sock in self._server.sockets or [])
         console.print(f"[bold green]EtherNet/IP mock listening on {addr}[/bold green]")
-        asyncio.create_task(self._update_loop())
+        self._timer_handle = loop.call_later(self.config.update_interval, self._schedule_randomize)
 
     async def stop(self) -> None:
         self._running = False
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
         if self._server:
             self._server.close()
             await self._server.wait_closed()
 
-    async def _update_loop(self) -> None:
-        while self._running:
-            await asyncio.sleep(self.config.update_interval)
-            self.tags.randomize()
-            if self.config.verbose:
-                console.print("[cyan]Updated mock telemetry[/cyan]")
-
-    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
-        peer = writer.get_extra_info("peername")
-        console.print(f"[yellow]Client connected {peer}[/yellow]")
-        try:
-            while data := await reader.readline():
-                data = data.strip()
-                if not data:
-                    continue
-                try:
-                    request = json.loads(data)
-                except json.JSONDecodeError:
-                    await self._send(writer, {"success": False, "error": "Invalid JSON"})
-                    continue
-                response = self._dispatch(request)
-                await self._send(writer, response)
-        finally:
-            writer.close()
-            await writer.wait_closed()
-            console.print(f"[yellow]Client disconnected {peer}[/yellow]")
+    def _schedule_randomize(self) -> None:
+        # Plain loop callback: no coroutine frame to resume per tick, and the handle stays cancellable.
+        self.tags.randomize()
+        if self.config.verbose:
+            logger.info("Updated mock telemetry")
+        self._timer_handle = asyncio.get_running_loop().call_later(
+            self.config.update_interval, self._schedule_randomize
+        )
+
+    def _respond(self, request: Dict[str, Any], encode: Callable[[Any], bytes]) -> bytes:
+        if request.get("op") == "list":
+            # Pollers re-list far more often than tags change; reuse the encoded body until then.
+            if self._list_version != self.tags.version:
+                self._list_cache.clear()
+                self._list_version = self.tags.version
+            body = self._list_cache.get(encode)
+            if body is None:
+                body = self._list_cache[encode] = encode(self._op_list(request))
+            return body
+        return encode(self._dispatch(request))
 
     def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
         op = request.get("op")
-        if op == "read":
-            tag = str(request.get("tag"))
-            try:
+        handler = self._ops.get(op) if isinstance(op, str) else None
+        if handler is None:
+            return {"success": False, "error": f"Unknown op '{op}'"}
+        return handler(request)
+
+    def _op_read(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        tag = str(request.get("tag"))
+        try:
+            entry = self.tags.read(tag)
+            return {"success": True, "data": {"tag": tag, "value": entry.value, "data_type": entry.data_type}}
+        except Exception as exc:
+            return {"success": False, "error": str(exc)}
+
+    def _op_write(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        tag = str(request.get("tag"))
+        value = request.get("value")
+        try:
+            entry = self.tags.write(tag, value)
+            return {"success": True, "data": {"tag": tag, "value": entry.value}}
+        except Exception as exc:
+            return {"success": False, "error": str(exc)}
+
+    def _op_read_many(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # One round trip for a batch of reads; fails as a whole on the first bad tag.
+        try:
+            data = []
+            for tag in request.get("tags") or []:
+                tag = str(tag)
                 entry = self.tags.read(tag)
-                return {"success": True, "data": {"tag": tag, "value": entry.value, "data_type": entry.data_type}}
-            except Exception as exc:
-                return {"success": False, "error": str(exc)}
-        if op == "write":
-            tag = str(request.get("tag"))
-            value = request.get("value")
-            try:
-                entry = self.tags.write(tag, value)
-                return {"success": True, "data": {"tag": tag, "value": entry.value}}
-            except Exception as exc:
-                return {"success": False, "error": str(exc)}
-        if op == "list":
-            table = [
-                {
-                    "tag": entry.name,
-                    "value": entry.value,
-                    "data_type": entry.data_type,
-                    "description": entry.description,
-                }
-                for entry in self.tags.tags.values()
-            ]
-            return {"success": True, "data": table}
-        return {"success": False, "error": f"Unknown op '{op}'"}
-
-    async def _send(self, writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
-        writer.write(json.dumps(message).encode("utf-8") + b"\n")
-        await writer.drain()
+                data.append({"tag": tag, "value": entry.value, "data_type": entry.data_type})
+            return {"success": True, "data": data}
+        except Exception as exc:
+            return {"success": False, "error": str(exc)}
+
+    def _op_write_many(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # Applied in order; writes before a failing tag are kept, as with separate write ops.
+        try:
+            data = []
+            for tag, value in (request.get("tags") or {}).items():
+                entry = self.tags.write(str(tag), value)
+                data.append({"tag": entry.name, "value": entry.value})
+            return {"success": True, "data": data}
+        except Exception as exc:
+            return {"success": False, "error": str(exc)}
+
+    def _op_list(self, request: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG002
+        table = [
+            {
+                "tag": entry.name,
+                "value": entry.value,
+                "data_type": entry.data_type,
+                "description": entry.description,
+            }
+            for entry in self.tags.tags.values()
+        ]
+        return {"success": True, "data": table}
 
 
 def parse_args() -> argparse.Namespace:
@@ -170,7 +376,13 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--host", default=env("127.0.0.1", "MOCK_ENIP_HOST"))
     parser.add_argument("--port", type=int, default=int(env("5025", "MOCK_ENIP_PORT")))
     parser.add_argument("--update-interval", type=float, default=float(env("1.5", "MOCK_ENIP_UPDATE_INTERVAL")))
-    parser.add_argument("--verbose", action="store_true", default=env("false", "MOCK_ENIP_VERBOSE").lower() in {"1", "true", "yes", "on"})
+    parser.add_argument("--verbose", action="store_true", default=env("false", "MOCK_ENIP_VERBOSE").lower() in _BOOL_TRUE)
+    parser.add_argument(
+        "--protocol",
+        choices=("json", "msgpack"),
+        default=env("json", "MOCK_ENIP_PROTOCOL"),
+        help="msgpack also accepts length-prefixed MessagePack frames; JSON lines keep working",
+    )
     return parser.parse_args()
 
 
@@ -197,8 +409,19 @@ async def run_server(config: MockConfig) -> None:
 
 def main() -> None:
     args = parse_args()
-    config = MockConfig(host=args.host, port=args.port, update_interval=args.update_interval, verbose=args.verbose)
-    asyncio.run(run_server(config))
+    config = MockConfig(
+        host=args.host,
+        port=args.port,
+        update_interval=args.update_interval,
+        verbose=args.verbose,
+        protocol=args.protocol,
+    )
+    if config.protocol == "msgpack" and msgpack is None:
+        raise SystemExit("--protocol msgpack requires the msgpack package (install the 'msgpack' extra)")
+    logging.basicConfig(level=logging.INFO if config.verbose else logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_server(config))
 
 
 if __name__ == "__main__":
@@ -1,31 +1,72 @@
-"""Thread-safe wrapper around pycomm3's LogixDriver."""
+"""Thread-safe wrapper around a small pool of pycomm3 LogixDriver connections."""
 
 from __future__ import annotations
 
 import json
+import operator
 import os
-import threading
+import queue
+import random
+import struct
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import anyio
+from anyio.streams.buffered import BufferedByteReceiveStream
 
 try:
     from pycomm3 import LogixDriver  # type: ignore
 except ImportError:  # pragma: no cover - runtime guard
     LogixDriver = None
 
+try:
+    from pycomm3.exceptions import RequestError  # type: ignore
+except ImportError:  # pragma: no cover - runtime guard
+    RequestError = None
+
+try:
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    msgpack = None
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None
+
 OperationMeta = Dict[str, Any]
 OperationResult = Tuple[Any, OperationMeta]
 OpCallable = Callable[[Any], Any]
 
+# MessagePack bridge frames: 4-byte big-endian body length, then the body.
+FRAME_HEADER = struct.Struct(">I")
+MAX_BRIDGE_RESPONSE = 64 * 1024 * 1024
+# Bridge ops that are safe to send again if a kept-alive connection turns out to be dead.
+_IDEMPOTENT_BRIDGE_OPS = frozenset({"read", "read_many", "list"})
+
+# Controller identity fields; firmware is reported from the same revision value.
+_INFO_FIELD_NAMES = ("name", "revision", "serial", "product_code")
+_INFO_FIELDS = operator.attrgetter(*_INFO_FIELD_NAMES)
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(message: Any) -> bytes:
+        return json.dumps(message).encode("utf-8")
+
+
+_BOOL_TRUE = frozenset({"1", "true", "yes", "y", "on"})
+
 
 def _env_bool(name: str, default: bool) -> bool:
     val = os.getenv(name)
     if val is None:
         return default
-    return val.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return val.strip().lower() in _BOOL_TRUE
 
 
 @dataclass(slots=True)
@@ -35,13 +76,19 @@ class EIPClientConfig:
     slot: int = 0
     path: Optional[str] = None
     json_bridge: bool = False
+    bridge_protocol: str = "json"
     timeout: float = 10.0
     max_retries: int = 3
     retry_backoff_base: float = 0.5
+    retry_max_delay: float = 30.0
+    retry_jitter: float = 0.5
     micro800: bool = False
     init_info: bool = True
     cache_tag_list: bool = True
     cache_timeout: int = 3600
+    read_batch_ms: float = 0.0
+    read_batch_max: int = 16
+    pool_size: int = 4
     debug: bool = False
 
     @classmethod
@@ -52,13 +99,19 @@ class EIPClientConfig:
             slot=int(os.getenv("ENIP_SLOT", "0")),
             path=os.getenv("ENIP_PATH"),
             json_bridge=_env_bool("ENIP_JSON_BRIDGE", False),
+            bridge_protocol=os.getenv("ENIP_BRIDGE_PROTOCOL", "json").strip().lower(),
             timeout=float(os.getenv("ENIP_TIMEOUT", "10")),
             max_retries=int(os.getenv("ENIP_MAX_RETRIES", "3")),
             retry_backoff_base=float(os.getenv("ENIP_RETRY_BACKOFF_BASE", "0.5")),
+            retry_max_delay=float(os.getenv("ENIP_RETRY_MAX_DELAY", "30")),
+            retry_jitter=float(os.getenv("ENIP_RETRY_JITTER", "0.5")),
             micro800=_env_bool("ENIP_MICRO800", False),
             init_info=_env_bool("ENIP_INIT_INFO", True),
             cache_tag_list=_env_bool("ENIP_CACHE_TAG_LIST", True),
             cache_timeout=int(os.getenv("ENIP_CACHE_TIMEOUT", "3600")),
+            read_batch_ms=float(os.getenv("ENIP_READ_BATCH_MS", "0")),
+            read_batch_max=int(os.getenv("ENIP_READ_BATCH_MAX", "16")),
+            pool_size=int(os.getenv("ENIP_POOL_SIZE", "4")),
             debug=_env_bool("ENIP_DEBUG", False),
         )
 
@@ -67,22 +120,170 @@ class EIPClientError(RuntimeError):
     """Raised when EtherNet/IP operations fail."""
 
 
+class _BridgeReplyStarted(Exception):
+    """Bridge connection failed after part of the reply had arrived, so the server saw the request."""
+
+
+# Failures that will repeat on every attempt (bad arguments, malformed requests, pycomm3 missing),
+# so they are raised straight away instead of waiting out the backoff schedule.
+_UNRECOVERABLE: Tuple[type, ...] = (TypeError, ValueError, AttributeError, EIPClientError)
+if RequestError is not None:
+    _UNRECOVERABLE += (RequestError,)
+
+
+class _DriverSlot:
+    __slots__ = ("driver", "connected")
+
+    def __init__(self) -> None:
+        self.driver: Optional[LogixDriver] = None
+        self.connected = False
+
+
+class _PendingRead:
+    __slots__ = ("tag", "wake", "batch", "result", "error")
+
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+        self.wake = anyio.Event()
+        # Set instead of a result when this caller is handed the next batch to issue.
+        self.batch: Optional[List["_PendingRead"]] = None
+        self.result: Optional[OperationResult] = None
+        self.error: Optional[BaseException] = None
+
+
+class _ReadBatcher:
+    """Coalesces concurrent scalar read_tag calls into driver.read(*tags) multi-requests.
+
+    Up to max_in_flight batches run at once (one per pooled driver). A read that finds a free
+    slot is issued at once, after an optional collection window, so sequential callers pay no
+    extra latency. Reads arriving while every slot is busy queue up and go out together as the
+    next batch, issued by the oldest waiting caller.
+    """
+
+    def __init__(self, client: "EIPClient", max_wait: float, max_batch: int, max_in_flight: int) -> None:
+        self._client = client
+        self._max_wait = max_wait
+        self._max_batch = max_batch
+        self._max_in_flight = max(max_in_flight, 1)
+        self._pending: List[_PendingRead] = []
+        self._in_flight = 0
+        self._full = anyio.Event()
+
+    async def read(self, tag: str) -> OperationResult:
+        entry = _PendingRead(tag)
+        self._pending.append(entry)
+        if self._in_flight < self._max_in_flight:
+            self._in_flight += 1
+            await self._lead(None)
+        elif len(self._pending) >= self._max_batch:
+            self._full.set()
+        try:
+            await entry.wake.wait()
+        finally:
+            if entry.batch is not None:
+                await self._lead(entry.batch)
+            elif entry.result is None and entry.error is None and entry in self._pending:
+                # Cancelled while still queued: nobody will issue this read now.
+                self._pending.remove(entry)
+        if entry.error is not None:
+            raise entry.error
+        assert entry.result is not None
+        return entry.result
+
+    def _take(self) -> List[_PendingRead]:
+        batch = self._pending[: self._max_batch]
+        del self._pending[: self._max_batch]
+        self._full = anyio.Event()
+        return batch
+
+    async def _lead(self, batch: Optional[List[_PendingRead]]) -> None:
+        # Shielded so a cancelled leader cannot strand the callers whose reads it carries.
+        with anyio.CancelScope(shield=True):
+            try:
+                if batch is None:
+                    if self._max_wait > 0 and len(self._pending) < self._max_batch:
+                        with anyio.move_on_after(self._max_wait):
+                            await self._full.wait()
+                    else:
+                        await anyio.lowlevel.checkpoint()
+                    batch = self._take()
+                if batch:
+                    await self._flush(batch)
+            finally:
+                if self._pending:
+                    # Hand this in-flight slot and the next batch to the oldest waiter.
+                    following = self._take()
+                    following[0].batch = following
+                    following[0].wake.set()
+                else:
+                    self._in_flight -= 1
+
+    async def _flush(self, batch: List[_PendingRead]) -> None:
+        tags = list(dict.fromkeys(entry.tag for entry in batch))
+        try:
+            result, meta = await self._client._execute_with_retry(
+                f"read_tag({', '.join(tags)})",
+                lambda driver: driver.read(*tags),
+            )
+            values = result if len(tags) > 1 else [result]
+            by_tag = dict(zip(tags, values))
+            if len(tags) > 1:
+                meta = {**meta, "batch_size": len(tags)}
+            for entry in batch:
+                entry.result = (by_tag[entry.tag], meta)
+        except Exception as exc:
+            for entry in batch:
+                entry.error = exc
+        finally:
+            for entry in batch:
+                entry.wake.set()
+
+
 class EIPClient:
     """Provides asynchronous helpers over pycomm3's synchronous driver."""
 
     def __init__(self, config: Optional[EIPClientConfig] = None) -> None:
         self.config = config or EIPClientConfig.from_env()
-        self._driver: Optional[LogixDriver] = None
-        self._lock = threading.RLock()
-        self._connected = False
-        self._tag_cache: Optional[Tuple[float, Any]] = None
+        # Idle driver slots. Each LogixDriver is built and opened on first use and is only ever
+        # driven by the one worker thread that took its slot, so no lock is needed around it.
+        self._slots = [_DriverSlot() for _ in range(max(self.config.pool_size, 1))]
+        self._pool: "queue.Queue[_DriverSlot]" = queue.Queue()
+        for slot in self._slots:
+            self._pool.put(slot)
+        self._pool_limiter: Optional[anyio.CapacityLimiter] = None
+        # program -> (monotonic fetch time, (tags, meta)) for controller tag lists.
+        self._tag_cache: Dict[Optional[str], Tuple[float, OperationResult]] = {}
+        # JSON bridge connection, kept open across requests.
+        self._bridge_stream: Optional[anyio.abc.SocketStream] = None
+        self._bridge_reader: Optional[BufferedByteReceiveStream] = None
+        self._bridge_lock: Optional[anyio.Lock] = None
+        self._read_batcher: Optional[_ReadBatcher] = None
+        if self.config.read_batch_max > 1:
+            self._read_batcher = _ReadBatcher(
+                self,
+                self.config.read_batch_ms / 1000.0,
+                self.config.read_batch_max,
+                len(self._slots),
+            )
 
     async def ensure_connection(self) -> None:
         if self.config.json_bridge:
             return
-        await anyio.to_thread.run_sync(self._connect_sync)
+        attempts = 0
+        while attempts <= self.config.max_retries:
+            attempts += 1
+            try:
+                await anyio.to_thread.run_sync(self._open_once_sync, limiter=self._driver_limiter())
+                return
+            except Exception as exc:  # pragma: no cover - depends on hardware
+                if attempts > self.config.max_retries or isinstance(exc, _UNRECOVERABLE):
+                    message = f"Failed to connect to {self.config.host}:{self.config.port} slot={self.config.slot}"
+                    raise EIPClientError(message) from exc
+                await anyio.sleep(self._backoff_delay(attempts))
 
     async def close(self) -> None:
+        self._tag_cache.clear()
+        await self._drop_bridge()
         await anyio.to_thread.run_sync(self._disconnect_sync)
 
     # -----------------------------
@@ -92,9 +293,11 @@ class EIPClient:
     async def read_tag(self, tag: str, count: Optional[int] = None) -> OperationResult:
         if self.config.json_bridge:
             return await self._json_read_tag(tag, count)
+        # Array reads stay separate; scalar reads may share one CIP multi-request with concurrent callers.
+        if count is None and self._read_batcher is not None:
+            return await self._read_batcher.read(tag)
         label = f"read_tag({tag})"
-        return await anyio.to_thread.run_sync(
-            self._execute_with_retry,
+        return await self._execute_with_retry(
             label,
             lambda driver: driver.read(tag, count=count) if count else driver.read(tag),
         )
@@ -103,8 +306,7 @@ class EIPClient:
         if self.config.json_bridge:
             return await self._json_write_tag(tag, value, data_type)
         label = f"write_tag({tag})"
-        _, meta = await anyio.to_thread.run_sync(
-            self._execute_with_retry,
+        _, meta = await self._execute_with_retry(
             label,
             lambda driver: driver.write(tag, value, datatype=data_type),
         )
@@ -113,39 +315,49 @@ class EIPClient:
     async def get_tag_list(self, program: Optional[str] = None) -> OperationResult:
         if self.config.json_bridge:
             return await self._json_get_tag_list(program)
+        # Tag definitions only change with a program download, so uploads are reused for cache_timeout seconds.
+        if self.config.cache_tag_list:
+            cached = self._tag_cache.get(program)
+            if cached is not None and time.monotonic() - cached[0] < self.config.cache_timeout:
+                tags, meta = cached[1]
+                return tags, {**meta, "cached": True}
         label = "get_tag_list" if not program else f"get_tag_list({program})"
-        return await anyio.to_thread.run_sync(
-            self._execute_with_retry,
+        result = await self._execute_with_retry(
             label,
             lambda driver: driver.get_tag_list(program=program),
         )
+        if self.config.cache_tag_list:
+            self._tag_cache[program] = (time.monotonic(), result)
+        return result
+
+    async def invalidate_tag_list(self) -> None:
+        """Drop cached tag lists, e.g. after a program download added or removed tags."""
+        self._tag_cache.clear()
 
     async def get_controller_info(self) -> OperationResult:
-        async def _fetch() -> OperationResult:
-            def _op(driver: LogixDriver) -> Dict[str, Any]:
-                driver_info = driver.info
-                return {
-                    "name": getattr(driver_info, "name", None),
-                    "revision": getattr(driver_info, "revision", None),
-                    "serial": getattr(driver_info, "serial", None),
-                    "product_code": getattr(driver_info, "product_code", None),
-                    "firmware": getattr(driver_info, "revision", None),
-                }
-
-            return await anyio.to_thread.run_sync(
-                self._execute_with_retry,
-                "get_controller_info",
-                _op,
-            )
+        def _op(driver: LogixDriver) -> Dict[str, Any]:
+            driver_info = driver.info
+            try:
+                name, revision, serial, product_code = _INFO_FIELDS(driver_info)
+            except AttributeError:
+                name, revision, serial, product_code = (
+                    getattr(driver_info, field, None) for field in _INFO_FIELD_NAMES
+                )
+            return {
+                "name": name,
+                "revision": revision,
+                "serial": serial,
+                "product_code": product_code,
+                "firmware": revision,
+            }
 
-        return await _fetch()
+        return await self._execute_with_retry("get_controller_info", _op)
 
     async def get_plc_time(self) -> OperationResult:
         if self.config.json_bridge:
             now = time.time()
             return {"plc_time": now}, {"backend": "json", "operation": "get_plc_time"}
-        return await anyio.to_thread.run_sync(
-            self._execute_with_retry,
+        return await self._execute_with_retry(
             "get_plc_time",
             lambda driver: driver.get_plc_time(),
         )
@@ -153,8 +365,7 @@ class EIPClient:
     async def set_plc_time(self, timestamp: Optional[Any] = None) -> OperationMeta:
         if self.config.json_bridge:
             return {"backend": "json", "operation": "set_plc_time", "updated": True}
-        _, meta = await anyio.to_thread.run_sync(
-            self._execute_with_retry,
+        _, meta = await self._execute_with_retry(
             "set_plc_time",
             lambda driver: driver.set_plc_time(timestamp),
         )
@@ -163,8 +374,7 @@ class EIPClient:
     async def read_multiple_tags(self, tags: list[str]) -> OperationResult:
         if self.config.json_bridge:
             return await self._json_read_multiple_tags(tags)
-        return await anyio.to_thread.run_sync(
-            self._execute_with_retry,
+        return await self._execute_with_retry(
             "read_multiple_tags",
             lambda driver: driver.read(*tags),
         )
@@ -172,8 +382,7 @@ class EIPClient:
     async def write_multiple_tags(self, payloads: Dict[str, Any]) -> OperationMeta:
         if self.config.json_bridge:
             return await self._json_write_multiple_tags(payloads)
-        _, meta = await anyio.to_thread.run_sync(
-            self._execute_with_retry,
+        _, meta = await self._execute_with_retry(
             "write_multiple_tags",
             lambda driver: driver.write(**payloads),
         )
@@ -181,7 +390,7 @@ class EIPClient:
 
     def connection_status(self) -> Dict[str, Any]:
         return {
-            "connected": self._connected,
+            "connected": any(slot.connected for slot in self._slots),
             "host": self.config.host,
             "port": self.config.port,
             "slot": self.config.slot,
@@ -194,30 +403,73 @@ class EIPClient:
     # -----------------------------
 
     async def _json_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        framed = self.config.bridge_protocol == "msgpack"
+        if framed and msgpack is None:
+            raise EIPClientError("ENIP_BRIDGE_PROTOCOL=msgpack requires the msgpack package (install the 'msgpack' extra)")
+        if self._bridge_lock is None:
+            # Created lazily because it must belong to the running event loop.
+            self._bridge_lock = anyio.Lock()
+        async with self._bridge_lock:
+            # The server may have closed a kept-alive connection since the last request. Reads
+            # are sent again once on a fresh connection, but only if no reply had started;
+            # writes are never resent, as the server may already have applied them.
+            retry = self._bridge_stream is not None and payload.get("op") in _IDEMPOTENT_BRIDGE_OPS
+            while True:
+                if self._bridge_stream is None:
+                    await self._open_bridge()
+                try:
+                    raw = await self._bridge_exchange(payload, framed)
+                    break
+                except Exception as exc:
+                    await self._drop_bridge()
+                    if retry and not isinstance(exc, _BridgeReplyStarted):
+                        retry = False
+                        continue
+                    raise EIPClientError(f"JSON bridge I/O error: {exc}") from exc
+                except BaseException:
+                    # Cancelled mid-exchange: the stream is out of step with the server.
+                    await self._drop_bridge()
+                    raise
+        try:
+            if framed:
+                return msgpack.unpackb(raw, raw=False)
+            return _loads(raw)
+        except Exception as exc:
+            raise EIPClientError(f"JSON bridge decode error: {exc}") from exc
+
+    async def _open_bridge(self) -> None:
         try:
             stream = await anyio.connect_tcp(self.config.host, self.config.port)
         except Exception as exc:
             message = f"JSON bridge connection failed to {self.config.host}:{self.config.port}: {exc}"
             raise EIPClientError(message) from exc
-        async with stream:
-            try:
-                await stream.send(json.dumps(payload).encode("utf-8") + b"\n")
-                # Read until newline manually since anyio SocketStream doesn't have receive_until
-                raw = b""
-                while True:
-                    chunk = await stream.receive(65536)
-                    if not chunk:
-                        break
-                    raw += chunk
-                    if b"\n" in raw:
-                        raw = raw.split(b"\n", 1)[0]
-                        break
-            except Exception as exc:
-                raise EIPClientError(f"JSON bridge I/O error: {exc}") from exc
+        self._bridge_stream = stream
+        self._bridge_reader = BufferedByteReceiveStream(stream)
+
+    async def _drop_bridge(self) -> None:
+        stream, self._bridge_stream, self._bridge_reader = self._bridge_stream, None, None
+        if stream is not None:
+            await anyio.aclose_forcefully(stream)
+
+    async def _bridge_exchange(self, payload: Dict[str, Any], framed: bool) -> bytes:
+        stream, reader = self._bridge_stream, self._bridge_reader
+        if framed:
+            # One length-prefixed request out, one length-prefixed response back; no delimiter scanning.
+            body = msgpack.packb(payload)
+            await stream.send(FRAME_HEADER.pack(len(body)) + body)
+        else:
+            await stream.send(_dumps(payload) + b"\n")
+        size: Optional[int] = None
         try:
-            return json.loads(raw.decode("utf-8"))
+            if framed:
+                (size,) = FRAME_HEADER.unpack(await reader.receive_exactly(FRAME_HEADER.size))
+                return await reader.receive_exactly(size)
+            # The buffered reader keeps anything past the newline for the next response.
+            return await reader.receive_until(b"\n", MAX_BRIDGE_RESPONSE)
         except Exception as exc:
-            raise EIPClientError(f"JSON bridge decode error: {exc}") from exc
+            if size is not None or reader.buffer:
+                raise _BridgeReplyStarted(f"{type(exc).__name__}: {exc}") from exc
+            raise
 
     async def _json_read_tag(self, tag: str, count: Optional[int] = None) -> OperationResult:  # noqa: ARG002 - count reserved for parity
         response = await self._json_request({"op": "read", "tag": tag})
@@ -257,10 +509,19 @@ class EIPClient:
         return data, meta
 
     async def _json_read_multiple_tags(self, tags: list[str]) -> OperationResult:
-        results = []
-        for tag in tags:
-            result, _ = await self._json_read_tag(tag)
-            results.append(result)
+        response = await self._json_request({"op": "read_many", "tags": tags})
+        if not response.get("success"):
+            raise EIPClientError(response.get("error") or "Mock server read failed")
+        results = [
+            {
+                "tag": data.get("tag"),
+                "value": data.get("value"),
+                "type": data.get("data_type"),
+                "status": None,
+                "error": None,
+            }
+            for data in response.get("data") or []
+        ]
         meta: OperationMeta = {
             "backend": "json",
             "operation": "read_multiple_tags",
@@ -269,8 +530,9 @@ class EIPClient:
         return results, meta
 
     async def _json_write_multiple_tags(self, payloads: Dict[str, Any]) -> OperationMeta:
-        for tag, value in payloads.items():
-            await self._json_write_tag(tag, value, None)
+        response = await self._json_request({"op": "write_many", "tags": payloads})
+        if not response.get("success"):
+            raise EIPClientError(response.get("error") or "Mock server write failed")
         meta: OperationMeta = {
             "backend": "json",
             "operation": "write_multiple_tags",
@@ -278,84 +540,117 @@ class EIPClient:
         }
         return meta
 
-    def _ensure_driver(self) -> LogixDriver:
+    def _build_driver(self) -> LogixDriver:
         if LogixDriver is None:  # pragma: no cover - runtime guard
             raise EIPClientError(
                 "pycomm3 is not installed. Install pycomm3 to communicate with EtherNet/IP controllers."
             )
-        if self._driver is None:
-            if self.config.path:
-                connection_path = self.config.path
-            elif self.config.slot and not self.config.micro800:
-                connection_path = f"{self.config.host}/{self.config.slot}"
-            else:
-                connection_path = self.config.host
-
-            driver_kwargs: Dict[str, Any] = {
-                "timeout": self.config.timeout,
-            }
-            if self.config.port:
-                driver_kwargs["port"] = self.config.port
-            if self.config.micro800:
-                driver_kwargs["micro800"] = True
-
-            self._driver = LogixDriver(connection_path, **driver_kwargs)
-        return self._driver
-
-    def _connect_sync(self) -> None:
-        with self._lock:
-            driver = self._ensure_driver()
-            if self._connected:
-                return
-        attempts = 0
-        last_exc: Optional[Exception] = None
-        while attempts <= self.config.max_retries:
-            attempts += 1
-            try:
-                with self._lock:
-                    driver.open()
-                    self._connected = True
-                    if self.config.init_info and hasattr(driver, "info"):
-                        _ = driver.info
-                return
-            except Exception as exc:  # pragma: no cover - depends on hardware
-                last_exc = exc
-                with self._lock:
-                    self._connected = False
-                if attempts > self.config.max_retries:
-                    message = f"Failed to connect to {self.config.host}:{self.config.port} slot={self.config.slot}"
-                    raise EIPClientError(message) from exc
-                time.sleep(self.config.retry_backoff_base * (2 ** (attempts - 1)))
+        if self.config.path:
+            connection_path = self.config.path
+        elif self.config.slot and not self.config.micro800:
+            connection_path = f"{self.config.host}/{self.config.slot}"
+        else:
+            connection_path = self.config.host
+
+        driver_kwargs: Dict[str, Any] = {
+            "timeout": self.config.timeout,
+        }
+        if self.config.port:
+            driver_kwargs["port"] = self.config.port
+        if self.config.micro800:
+            driver_kwargs["micro800"] = True
 
-    def _disconnect_sync(self) -> None:
-        with self._lock:
-            if self._driver is None:
-                return
-            try:
-                self._driver.close()
-            finally:
-                self._connected = False
+        return LogixDriver(connection_path, **driver_kwargs)
 
-    def _execute_with_retry(self, label: str, operation: OpCallable) -> OperationResult:
+    def _driver_limiter(self) -> anyio.CapacityLimiter:
+        # One worker thread per pooled driver, so _pool.get() never blocks a thread.
+        if self._pool_limiter is None:
+            self._pool_limiter = anyio.CapacityLimiter(len(self._slots))
+        return self._pool_limiter
+
+    def _open_slot_sync(self, slot: _DriverSlot) -> None:
+        if slot.connected:
+            return
+        if slot.driver is None:
+            slot.driver = self._build_driver()
+        try:
+            slot.driver.open()
+            slot.connected = True
+            if self.config.init_info and hasattr(slot.driver, "info"):
+                _ = slot.driver.info
+        except Exception:
+            slot.connected = False
+            raise
+
+    def _open_once_sync(self) -> None:
+        # Single open attempt; callers own the retry loop so backoff never holds a worker thread.
+        slot = self._pool.get()
+        try:
+            self._open_slot_sync(slot)
+        finally:
+            self._pool.put(slot)
+
+    def _disconnect_sync(self) -> None:
+        # Check every slot out first: a driver still busy in another worker thread is only
+        # closed once that operation has returned it to the pool.
+        slots = [self._pool.get() for _ in self._slots]
+        errors: List[Exception] = []
+        try:
+            for slot in slots:
+                if slot.driver is None:
+                    continue
+                try:
+                    slot.driver.close()
+                except Exception as exc:  # pragma: no cover - depends on hardware
+                    errors.append(exc)
+                finally:
+                    slot.connected = False
+        finally:
+            for slot in slots:
+                self._pool.put(slot)
+        if errors:
+            raise errors[0]
+
+    async def _execute_with_retry(self, label: str, operation: OpCallable) -> OperationResult:
         start = time.perf_counter()
         attempt = 0
         last_exc: Optional[Exception] = None
         while attempt <= self.config.max_retries:
             attempt += 1
             try:
-                with self._lock:
-                    driver = self._ensure_driver()
-                    if not self._connected:
-                        self._connect_sync()
-                    result = operation(driver)
+                result = await anyio.to_thread.run_sync(
+                    self._execute_once_sync, operation, limiter=self._driver_limiter()
+                )
                 duration = (time.perf_counter() - start) * 1000.0
                 return result, {"attempts": attempt, "duration_ms": round(duration, 3)}
+            except _UNRECOVERABLE as exc:
+                last_exc = exc
+                break
             except Exception as exc:  # pragma: no cover - depends on runtime I/O
                 last_exc = exc
-                with self._lock:
-                    self._connected = False
                 if attempt > self.config.max_retries:
                     break
-                time.sleep(self.config.retry_backoff_base * (2 ** (attempt - 1)))
+                # Back off on the event loop so the worker thread goes back to the pool meanwhile.
+                await anyio.sleep(self._backoff_delay(attempt))
         message = f"{label} failed after {attempt} attempts: {last_exc}"
         raise EIPClientError(message) from last_exc
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # Capped exponential backoff, spread by +/- retry_jitter so clients that failed together
+        # do not all retry the controller at the same instant.
+        delay = min(self.config.retry_max_delay, self.config.retry_backoff_base * (2 ** (attempt - 1)))
+        jitter = min(max(self.config.retry_jitter, 0.0), 1.0)
+        if jitter:
+            delay *= 1.0 - jitter + random.random() * 2.0 * jitter
+        return min(delay, self.config.retry_max_delay)
+
+    def _execute_once_sync(self, operation: OpCallable) -> Any:
+        slot = self._pool.get()
+        try:
+            self._open_slot_sync(slot)
+            return operation(slot.driver)
+        except Exception:
+            slot.connected = False
+            raise
+        finally:
+            self._pool.put(slot)
@@ -4,13 +4,19 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Dict
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 
 from .eip_client import EIPClient
 from .tools import TagMap, ToolConfig, ToolResources, register_tools
 
+try:
+    import uvloop  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    uvloop = None
+
 
 @dataclass(slots=True)
 class AppContext:
@@ -30,7 +36,7 @@ class EtherNetIPMCPServer:
         self.resources = ToolResources(
             client=self.client,
             config=self.tool_config,
-            tag_map=TagMap(self.tool_config.tag_map_path),
+            tag_map=TagMap(self.tool_config.tag_map_path, self.tool_config.tag_map_stat_interval_ms),
         )
         self._server = FastMCP(
             name="EtherNet/IP MCP Server",
@@ -40,10 +46,17 @@ class EtherNetIPMCPServer:
         register_tools(self._server, self.resources)
 
     def run(self) -> None:
-        self._server.run()
+        # Same as FastMCP.run() for stdio, but lets the loop come from uvloop when installed.
+        backend_options: Dict[str, Any] = {}
+        if uvloop is not None:
+            backend_options["loop_factory"] = uvloop.new_event_loop
+        anyio.run(self._server.run_stdio_async, backend_options=backend_options)
 
     @asynccontextmanager
     async def _lifespan(self, server: FastMCP) -> AsyncIterator[AppContext]:  # noqa: ARG002 - signature contract
+        if self.tool_config.thread_tokens:
+            # Driver calls are capped by the client's own pool limiter; this sizes anyio's shared pool.
+            anyio.to_thread.current_default_thread_limiter().total_tokens = self.tool_config.thread_tokens
         await self.client.ensure_connection()
         try:
             yield AppContext(client=self.client)
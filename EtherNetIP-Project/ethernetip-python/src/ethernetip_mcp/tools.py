@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -12,6 +13,13 @@ from mcp.server.fastmcp import Context, FastMCP
 
 from .eip_client import EIPClient
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 def _env_bool(name: str, default: bool) -> bool:
     val = os.getenv(name)
@@ -25,46 +33,65 @@ class ToolConfig:
     writes_enabled: bool = True
     system_cmds_enabled: bool = False
     tag_map_path: Optional[Path] = None
+    tag_map_stat_interval_ms: int = 500
+    thread_tokens: Optional[int] = None
 
     @classmethod
     def from_env(cls) -> "ToolConfig":
         tag_path = os.getenv("TAG_MAP_FILE")
+        thread_tokens = os.getenv("MCP_THREAD_TOKENS")
         return cls(
             writes_enabled=_env_bool("ENIP_WRITES_ENABLED", True),
             system_cmds_enabled=_env_bool("ENIP_SYSTEM_CMDS_ENABLED", False),
             tag_map_path=Path(tag_path).expanduser() if tag_path else None,
+            tag_map_stat_interval_ms=int(os.getenv("TAG_MAP_STAT_INTERVAL_MS", "500")),
+            thread_tokens=int(thread_tokens) if thread_tokens else None,
         )
 
 
 class TagMap:
-    def __init__(self, path: Optional[Path]) -> None:
+    __slots__ = ("path", "_stat_interval_ns", "_last_stat_ns", "_tags", "_mtime", "_list_cache")
+
+    def __init__(self, path: Optional[Path], stat_interval_ms: int = 500) -> None:
         self.path = path
+        self._stat_interval_ns = max(0, stat_interval_ms) * 1_000_000
+        self._last_stat_ns = 0
         self._tags: Dict[str, Dict[str, Any]] = {}
-        self._mtime: Optional[float] = None
+        self._mtime: Optional[int] = None  # st_mtime_ns of the loaded file
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
         self.refresh()
 
     def refresh(self) -> None:
         if not self.path:
             self._tags = {}
+            self._list_cache = None
             self._mtime = None
             return
+        # Alias tools refresh on every call; stat() the file at most once per interval.
+        now = time.monotonic_ns()
+        if self._mtime is not None and now - self._last_stat_ns < self._stat_interval_ns:
+            return
+        self._last_stat_ns = now
         try:
             stat = self.path.stat()
         except FileNotFoundError:
             self._tags = {}
+            self._list_cache = None
             self._mtime = None
             return
-        if self._mtime and stat.st_mtime <= self._mtime:
+        if self._mtime is not None and stat.st_mtime_ns <= self._mtime:
             return
         try:
-            with self.path.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, dict):
-                    self._tags = {str(name): spec for name, spec in data.items()}
-                    self._mtime = stat.st_mtime
+            data = _loads(self.path.read_bytes())
+            if isinstance(data, dict):
+                # JSON object keys are always str, so the parsed dict is used as-is.
+                self._tags = data
+                self._list_cache = None
+                self._mtime = stat.st_mtime_ns
         except Exception:
             self._tags = {}
-            self._mtime = stat.st_mtime
+            self._list_cache = None
+            self._mtime = stat.st_mtime_ns
 
     def get(self, name: str) -> Optional[Dict[str, Any]]:
         self.refresh()
@@ -72,15 +99,18 @@ class TagMap:
 
     def list(self) -> List[Dict[str, Any]]:
         self.refresh()
-        return [
-            {
-                "alias": alias,
-                "tag": spec.get("tag"),
-                "data_type": spec.get("data_type"),
-                "description": spec.get("description"),
-            }
-            for alias, spec in self._tags.items()
-        ]
+        # Rebuilt only after refresh() loads a new version of the file.
+        if self._list_cache is None:
+            self._list_cache = [
+                {
+                    "alias": alias,
+                    "tag": spec.get("tag"),
+                    "data_type": spec.get("data_type"),
+                    "description": spec.get("description"),
+                }
+                for alias, spec in self._tags.items()
+            ]
+        return self._list_cache
 
     def count(self) -> int:
         self.refresh()
@@ -95,7 +125,7 @@ class ToolResources:
 
 
 def register_tools(server: FastMCP, resources: ToolResources) -> None:
-    tag_map = resources.tag_map or TagMap(resources.config.tag_map_path)
+    tag_map = resources.tag_map or TagMap(resources.config.tag_map_path, resources.config.tag_map_stat_interval_ms)
 
     def _client(ctx: Context) -> EIPClient:
         return ctx.request_context.lifespan_context.client
@@ -210,9 +240,12 @@ def register_tools(server: FastMCP, resources: ToolResources) -> None:
         return await write_tag(tag_name, value, ctx)
 
     @server.tool()
-    async def get_tag_list(ctx: Context, program: Optional[str] = None) -> Dict[str, Any]:
+    async def get_tag_list(ctx: Context, program: Optional[str] = None, refresh: bool = False) -> Dict[str, Any]:
         try:
-            result, meta = await _client(ctx).get_tag_list(program)
+            client = _client(ctx)
+            if refresh:
+                await client.invalidate_tag_list()
+            result, meta = await client.get_tag_list(program)
         except Exception as exc:
             return _err(str(exc), {"program": program})
         return _ok(data={"program": program, "tags": result}, meta=meta)